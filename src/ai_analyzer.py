@@ -4,17 +4,96 @@ Analyzes PRs with batching to avoid token limits
 """
 
 import os
+import re
 import json
-from typing import List, Dict, Optional
-from groq import Groq
+import asyncio
+import random
+import hashlib
+from collections import Counter
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
+import httpx
+from groq import (
+    AsyncGroq,
+    DefaultAsyncHttpxClient,
+    APIConnectionError,
+    APIStatusError,
+    InternalServerError,
+    RateLimitError,
+)
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 
+from . import json_utils
 from .local_loader import LocalPRLoader
 
 
 console = Console()
 
+# Markdown code fence that LLMs sometimes wrap JSON in
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+_JSON_DECODER = json.JSONDecoder()
+# Words and single punctuation characters, used for token estimation
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def _extract_json(content: str) -> Dict:
+    """
+    Extract the JSON object from an LLM response
+
+    Handles markdown code fences and prose before or after the object.
+
+    Raises:
+        json.JSONDecodeError: If no JSON object can be decoded
+    """
+    # With JSON mode the whole response is the object
+    try:
+        return json_utils.loads(content)
+    except json.JSONDecodeError:
+        pass
+
+    match = _FENCE_RE.search(content)
+    if match:
+        content = match.group(1)
+
+    start = content.find("{")
+    result, _ = _JSON_DECODER.raw_decode(content, max(start, 0))
+    return result
+
+
+def _output_token_budget(fields: List[str], items: int, ceiling: int) -> int:
+    """
+    Estimate max_tokens for a response from the expected amount of output
+
+    Args:
+        fields: Fields the model fills
+        items: Number of PRs (or partial results) the response covers
+        ceiling: Upper limit
+
+    Returns:
+        Output token limit
+    """
+    # ~150 tokens per field per item, at least 5 items worth
+    return min(ceiling, 150 * len(fields) * max(5, items))
+
+
+def _pr_topic(pr: Dict) -> Tuple[str, str]:
+    """
+    Get grouping key for a PR: repository and most common file extension
+
+    Args:
+        pr: PR dictionary
+
+    Returns:
+        Tuple of (repository URL, file extension)
+    """
+    extensions = Counter(
+        os.path.splitext(f.get('filename') or '')[1].lower()
+        for f in pr.get('files') or ()
+    )
+    extension = extensions.most_common(1)[0][0] if extensions else ''
+    return pr.get('repository_url') or '', extension
+
 
 class PRBatcher:
     """Handles batching of PRs for LLM processing"""
@@ -22,15 +101,15 @@ class PRBatcher:
     def __init__(self, batch_size: int = 15):
         self.batch_size = batch_size
 
-    def create_batches(self, prs: List[Dict]) -> List[List[Dict]]:
+    def create_batches(self, prs: List[str]) -> List[List[str]]:
         """
         Split PRs into manageable batches
 
         Args:
-            prs: List of PR dictionaries
+            prs: List of compressed PR texts
 
         Returns:
-            List of batches (each batch is a list of PRs)
+            List of batches (each batch is a list of PR texts)
         """
         if not prs:
             return []
@@ -42,9 +121,43 @@ class PRBatcher:
 
         return batches
 
+    def create_token_batches(self, prs: List[str], max_input_tokens: int = 8000) -> List[List[str]]:
+        """
+        Pack PRs into batches by estimated token count
+
+        A batch is closed when the next PR would exceed the budget. A PR
+        larger than the budget gets a batch of its own.
+
+        Args:
+            prs: List of compressed PR texts
+            max_input_tokens: Token budget per batch
+
+        Returns:
+            List of batches (each batch is a list of PR texts)
+        """
+        batches = []
+        batch = []
+        batch_tokens = 0
+
+        for pr_text in prs:
+            tokens = self.estimate_tokens(pr_text)
+
+            if batch and batch_tokens + tokens > max_input_tokens:
+                batches.append(batch)
+                batch = []
+                batch_tokens = 0
+
+            batch.append(pr_text)
+            batch_tokens += tokens
+
+        if batch:
+            batches.append(batch)
+
+        return batches
+
     def estimate_tokens(self, text: str) -> int:
         """
-        Rough estimation of token count
+        Estimate token count without a model-specific tokenizer
 
         Args:
             text: Text to estimate
@@ -52,24 +165,42 @@ class PRBatcher:
         Returns:
             Estimated token count
         """
-        # Rough estimation: ~4 characters per token
-        return len(text) // 4
+        # Punctuation is usually a token of its own and long identifiers
+        # split into pieces of ~4 characters, which len(text) // 4 misses
+        # on code-heavy text
+        return sum((len(piece) + 3) // 4 for piece in _TOKEN_RE.findall(text))
 
 
 class GroqAnalyzer:
     """Groq AI analyzer with batching support"""
 
-    def __init__(self, api_key: str, model: str = "llama-3.3-70b-versatile"):
-        self.client = Groq(api_key=api_key)
-        self.model = model
+    def __init__(
+        self,
+        api_key: str,
+        batch_model: str = "llama-3.1-8b-instant",
+        aggregate_model: str = "llama-3.3-70b-versatile",
+        max_concurrency: int = 4,
+        cache_dir: Optional[Path] = None
+    ):
+        self.api_key = api_key
+        # Client of the running analysis, created by _run in its event loop
+        self.client: Optional[AsyncGroq] = None
+        # Per-batch extraction is mechanical, a small fast model is enough;
+        # the final aggregation benefits from the larger model
+        self.batch_model = batch_model
+        self.aggregate_model = aggregate_model
+        self.max_concurrency = max_concurrency
+        # Parsed responses are cached on disk by prompt hash (None disables)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self.batcher = PRBatcher()
-        self.loader = None
+        self.loader = LocalPRLoader(Path("."))
 
     def analyze_prs(
         self,
         prs: List[Dict],
         fields: List[str],
-        batch_size: int = 15
+        batch_size: int = 15,
+        max_batch_tokens: Optional[int] = None
     ) -> Dict:
         """
         Analyze PRs with batching
@@ -78,6 +209,7 @@ class GroqAnalyzer:
             prs: List of PR dictionaries
             fields: List of field names to fill
             batch_size: Number of PRs per batch
+            max_batch_tokens: If set, pack batches by estimated input tokens instead of count
 
         Returns:
             Dictionary with filled fields and summary
@@ -86,78 +218,188 @@ class GroqAnalyzer:
             console.print("[yellow]⚠️  No PRs to analyze[/yellow]")
             return {"fields": {}, "summary": "No data available"}
 
-        self.batcher.batch_size = batch_size
-        batches = self.batcher.create_batches(prs)
+        # Keep PRs of the same repository and stack together so each batch
+        # covers one topic (stable sort keeps newest-first order inside groups)
+        prs = sorted(prs, key=_pr_topic)
+
+        # Compress every PR once; batches only join the ready texts
+        compressed_prs = [self.loader.compress_pr_data(pr) for pr in prs]
+
+        if max_batch_tokens:
+            batches = self.batcher.create_token_batches(compressed_prs, max_batch_tokens)
+        else:
+            self.batcher.batch_size = batch_size
+            batches = self.batcher.create_batches(compressed_prs)
 
         console.print(f"\n[cyan]📊 Analysis Plan:[/cyan]")
         console.print(f"  Total PRs: {len(prs)}")
         console.print(f"  Batches: {len(batches)}")
-        console.print(f"  Batch size: {batch_size}\n")
+        if max_batch_tokens:
+            console.print(f"  Batch budget: ~{max_batch_tokens} tokens")
+        else:
+            console.print(f"  Batch size: {batch_size}")
+        console.print(f"  Concurrency: {self.max_concurrency}\n")
 
-        # Analyze each batch
-        batch_results = []
+        return asyncio.run(self._run(batches, fields, len(prs)))
+
+    def _create_client(self) -> AsyncGroq:
+        """
+        Create the Groq client for one analysis run
+
+        The connection pool is bound to the event loop it is used in, so
+        every asyncio.run gets its own client, closed before the loop ends.
+        """
+        # One pooled keep-alive client, sized so concurrent batches reuse
+        # connections instead of opening new TLS sessions
+        # Retries are handled in _complete, so disable the SDK's own
+        return AsyncGroq(
+            api_key=self.api_key,
+            max_retries=0,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency
+                )
+            )
+        )
+
+    async def _run(self, batches: List[List[str]], fields: List[str], total_prs: int) -> Dict:
+        """
+        Analyze all batches concurrently, then aggregate
+
+        Args:
+            batches: List of batches of compressed PR texts
+            fields: List of field names to fill
+            total_prs: Total number of PRs analyzed
 
-        with Progress(
-            SpinnerColumn(),
+        Returns:
+            Dictionary with filled fields and summary
+        """
+        async with self._create_client() as self.client:
+            try:
+                return await self._run_batches(batches, fields, total_prs)
+            finally:
+                self.client = None
+
+    async def _run_batches(self, batches: List[List[str]], fields: List[str], total_prs: int) -> Dict:
+        """Analyze all batches and aggregate them with the current client"""
+        # Limit in-flight requests to stay within Groq rate limits
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        # Spinner and bar need frequent redraws; for many batches or high
+        # concurrency, show only the completed percentage
+        columns = [
             TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=console
-        ) as progress:
+            TaskProgressColumn()
+        ]
+        if len(batches) <= 50 and self.max_concurrency <= 4:
+            columns = [SpinnerColumn(), columns[0], BarColumn(), columns[1]]
+
+        with Progress(*columns, console=console) as progress:
             task = progress.add_task(
                 "[cyan]Analyzing batches...",
                 total=len(batches)
             )
 
-            for i, batch in enumerate(batches, 1):
-                progress.update(
-                    task,
-                    description=f"[cyan]Analyzing batch {i}/{len(batches)}..."
-                )
-
-                result = self._analyze_batch(batch, fields)
-                batch_results.append(result)
-
+            async def run_batch(batch: List[str]) -> Dict:
+                async with semaphore:
+                    result = await self._analyze_batch(batch, fields)
                 progress.update(task, advance=1)
+                return result
+
+            # gather preserves batch order in the results
+            batch_results = await asyncio.gather(*[run_batch(batch) for batch in batches])
 
         # Aggregate results
         console.print("\n[cyan]🔄 Aggregating results...[/cyan]")
-        final_result = self._aggregate_results(batch_results, fields, len(prs))
+        partial_results = await self._reduce_results(list(batch_results), fields, semaphore)
+        final_result = await self._aggregate_results(partial_results, fields, total_prs)
 
         return final_result
 
-    def _analyze_batch(self, batch: List[Dict], fields: List[str]) -> Dict:
+    async def _reduce_results(
+        self,
+        batch_results: List[Dict],
+        fields: List[str],
+        semaphore: asyncio.Semaphore
+    ) -> List[Dict]:
         """
-        Analyze single batch of PRs
+        Merge batch results pairwise until at most two are left
+
+        Each level merges pairs concurrently with the batch model, so every
+        prompt stays small and the final aggregation call gets a bounded input.
 
         Args:
-            batch: List of PR dictionaries
-            fields: Fields to extract
+            batch_results: List of batch analysis results
+            fields: Field names
+            semaphore: Limits concurrent requests
 
         Returns:
-            Partial analysis result
+            At most two partial results
+        """
+        async def merge(left: Dict, right: Dict) -> Dict:
+            async with semaphore:
+                return await self._merge_pair(left, right, fields)
+
+        while len(batch_results) > 2:
+            merged = await asyncio.gather(*[
+                merge(batch_results[i], batch_results[i + 1])
+                for i in range(0, len(batch_results) - 1, 2)
+            ])
+            if len(batch_results) % 2:
+                merged.append(batch_results[-1])
+            batch_results = list(merged)
+
+        return batch_results
+
+    async def _merge_pair(self, left: Dict, right: Dict, fields: List[str]) -> Dict:
         """
-        # Initialize loader if needed
-        if not self.loader:
-            self.loader = LocalPRLoader(Path("."))
+        Merge two partial results into one
 
-        # Compress PR data
-        compressed_prs = []
-        for pr in batch:
-            compressed = self.loader.compress_pr_data(pr)
-            compressed_prs.append(compressed)
+        Returns:
+            Partial result with the same structure as a batch result
+        """
+        try:
+            return await self._request_json(
+                self._merge_system_prompt(fields),
+                f"Partial Results (one JSON object per batch):\n{self._format_partial_results([left, right])}",
+                model=self.batch_model,
+                max_tokens=_output_token_budget(fields, 10, 4000)
+            )
+        except Exception as e:
+            console.print(f"[yellow]⚠️  Failed to merge partial results, combining manually: {e}[/yellow]")
+            merged = self._manual_aggregation([left, right], fields)
+            return {
+                "fields": merged["fields"],
+                "partial_summary": " ".join(
+                    r.get("partial_summary", "") for r in (left, right) if r.get("partial_summary")
+                )
+            }
 
-        prs_text = "\n\n---\n\n".join(compressed_prs)
+    def _format_partial_results(self, batch_results: List[Dict]) -> str:
+        """Serialize partial results as one compact JSON line per batch"""
+        return "\n".join(
+            json_utils.dumps({
+                "batch": i,
+                "fields": result.get("fields", {}),
+                "summary": result.get("partial_summary", "")
+            })
+            for i, result in enumerate(batch_results, 1)
+        )
+
+    def _batch_system_prompt(self, fields: List[str]) -> str:
+        """
+        Build the static system prompt for batch analysis
 
-        # Create prompt
-        prompt = f"""You are analyzing pull requests for a professional resume. Write from the developer's perspective in first person.
+        Only depends on the requested fields, so it stays identical across
+        batches and can be served from the provider's prompt cache.
+        The volatile PR text goes into the user message.
+        """
+        return f"""You are writing a professional resume from the developer's perspective. Analyze code changes to identify exact technologies and write in first person: 'I implemented...', 'I developed...', 'I architected...'. Be specific about technologies, frameworks, and libraries seen in the code.
 
-Analyze these {len(batch)} pull requests and extract information for the following fields:
+Analyze the pull requests provided by the user and extract information for the following fields:
 {', '.join(fields)}
 
-Pull Requests (with code snippets):
-{prs_text}
-
 Instructions:
 1. Analyze code patches to identify EXACT technologies, frameworks, and libraries used (e.g., "Chakra UI", "Framer Motion", not just "React")
 2. Extract specific features and technical achievements from the code
@@ -175,79 +417,36 @@ Output must be valid JSON with this structure:
 
 Focus on technical depth, specific technologies from code, and professional achievements."""
 
-        try:
-            response = self.client.chat.completions.create(
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are writing a professional resume from the developer's perspective. Analyze code changes to identify exact technologies and write in first person: 'I implemented...', 'I developed...', 'I architected...'. Be specific about technologies, frameworks, and libraries seen in the code."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                model=self.model,
-                temperature=0.3,
-                max_tokens=4000
-            )
-
-            content = response.choices[0].message.content.strip()
+    def _merge_system_prompt(self, fields: List[str]) -> str:
+        """Build the static system prompt for merging two partial results"""
+        return f"""You are writing a professional resume from the developer's perspective in first person: 'I implemented...', 'I developed...', 'I architected...'.
 
-            # Try to parse JSON from response
-            # Sometimes LLM wraps JSON in markdown code blocks
-            if content.startswith("```json"):
-                content = content[7:]
-            if content.startswith("```"):
-                content = content[3:]
-            if content.endswith("```"):
-                content = content[:-3]
+Merge the partial analysis results provided by the user into a single partial result for the following fields:
+{', '.join(fields)}
 
-            result = json.loads(content.strip())
-            return result
+Instructions:
+1. Combine the field lists, remove duplicates and keep the most specific items
+2. Keep exact technologies, frameworks, and libraries
+3. Combine the summaries into one brief first-person summary
 
-        except json.JSONDecodeError as e:
-            console.print(f"[yellow]⚠️  Failed to parse JSON from LLM response: {e}[/yellow]")
-            # Return empty structure
-            return {
-                "fields": {field: [] for field in fields},
-                "partial_summary": ""
-            }
-        except Exception as e:
-            console.print(f"[red]❌ Error analyzing batch: {e}[/red]")
-            return {
-                "fields": {field: [] for field in fields},
-                "partial_summary": ""
-            }
+Output must be valid JSON with this structure:
+{{
+  "fields": {{
+    "{fields[0]}": ["I implemented feature X using technology Y", "I developed..."],
+    ...
+  }},
+  "partial_summary": "Brief first-person summary: I worked on..., I implemented..."
+}}"""
 
-    def _aggregate_results(self, batch_results: List[Dict], fields: List[str], total_prs: int) -> Dict:
+    def _aggregate_system_prompt(self, fields: List[str]) -> str:
         """
-        Aggregate all batch results into final output
+        Build the static system prompt for result aggregation
 
-        Args:
-            batch_results: List of batch analysis results
-            fields: Field names
-            total_prs: Total number of PRs analyzed
-
-        Returns:
-            Final aggregated result
+        Partial results and totals are sent in the user message.
         """
-        # Prepare aggregation prompt
-        batch_summaries = []
-        for i, result in enumerate(batch_results, 1):
-            batch_summaries.append(f"Batch {i}: {result.get('partial_summary', '')}")
-
-        all_results_text = json.dumps(batch_results, indent=2)
+        return f"""You are writing a professional technical resume from the developer's perspective. Write in first person using formal professional style: 'I implemented...', 'I developed...', 'I architected...'. Create comprehensive summaries that highlight technical achievements, exact technologies used, and measurable impact.
 
-        prompt = f"""Combine these {len(batch_results)} partial analysis results into a final comprehensive resume output.
-
-Partial Results:
-{all_results_text}
-
-Batch Summaries:
-{chr(10).join(batch_summaries)}
-
-Total PRs analyzed: {total_prs}
+Combine the partial analysis results provided by the user into a final comprehensive resume output.
 
 Tasks:
 1. Merge all field lists (combine items, remove duplicates, keep most important)
@@ -270,34 +469,185 @@ The summary should:
 - Demonstrate technical depth and leadership
 - Be written in professional first-person style suitable for a resume"""
 
+    async def _complete(self, system_prompt: str, user_prompt: str, model: str, max_tokens: int) -> str:
+        """
+        Run a streamed JSON-mode chat completion and return the full response text
+
+        Chunks are consumed as they arrive instead of waiting for the whole
+        completion to be generated server-side. JSON mode makes the server
+        constrain output to a valid JSON object.
+
+        Args:
+            system_prompt: Static system message
+            user_prompt: Volatile user message
+            model: Groq model name
+            max_tokens: Output token limit
+
+        Returns:
+            Response content
+        """
+        max_retries = 5
+
+        for attempt in range(1, max_retries + 1):
+            try:
+                stream = await self.client.chat.completions.create(
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": system_prompt
+                        },
+                        {
+                            "role": "user",
+                            "content": user_prompt
+                        }
+                    ],
+                    model=model,
+                    temperature=0.3,
+                    max_tokens=max_tokens,
+                    response_format={"type": "json_object"},
+                    stream=True
+                )
+
+                parts = []
+                async for chunk in stream:
+                    if chunk.choices:
+                        parts.append(chunk.choices[0].delta.content or "")
+
+                return "".join(parts).strip()
+
+            except (RateLimitError, InternalServerError, APIConnectionError) as e:
+                # Transient: 429, 5xx, network errors and timeouts
+                if attempt >= max_retries:
+                    raise
+
+                delay = self._retry_delay(e, attempt)
+                console.print(f"[yellow]Groq request failed ({e.__class__.__name__}), retrying in {delay:.1f}s... ({attempt}/{max_retries})[/yellow]")
+                await asyncio.sleep(delay)
+
+        raise RuntimeError("Max retries exceeded")
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """
+        Compute delay before the next retry
+
+        Honors the Retry-After header when the server sends one, otherwise
+        uses exponential backoff. Jitter keeps concurrent batches from
+        retrying in lockstep.
+        """
+        delay = min(2 ** attempt, 30)
+
+        if isinstance(error, APIStatusError):
+            retry_after = error.response.headers.get("retry-after")
+            try:
+                delay = float(retry_after)
+            except (TypeError, ValueError):
+                pass
+
+        return delay + random.random()
+
+    async def _request_json(self, system_prompt: str, user_prompt: str, model: str, max_tokens: int) -> Dict:
+        """
+        Get a parsed JSON response, using the on-disk cache when enabled
+
+        Only successfully parsed responses are cached, so a malformed
+        answer is retried on the next run.
+
+        Raises:
+            json.JSONDecodeError: If the response is still not valid JSON after one retry
+        """
+        cache_path = None
+        if self.cache_dir:
+            key = hashlib.sha256(
+                "\0".join([model, str(max_tokens), system_prompt, user_prompt]).encode("utf-8")
+            ).hexdigest()
+            cache_path = self.cache_dir / f"{key}.json"
+
+            if cache_path.exists():
+                try:
+                    return json_utils.loads(cache_path.read_bytes())
+                except (OSError, json.JSONDecodeError):
+                    pass  # Corrupted entry, request again
+
         try:
-            response = self.client.chat.completions.create(
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are writing a professional technical resume from the developer's perspective. Write in first person using formal professional style: 'I implemented...', 'I developed...', 'I architected...'. Create comprehensive summaries that highlight technical achievements, exact technologies used, and measurable impact."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                model=self.model,
-                temperature=0.3,
-                max_tokens=6000
+            content = await self._complete(system_prompt, user_prompt, model=model, max_tokens=max_tokens)
+            result = _extract_json(content)
+        except json.JSONDecodeError:
+            # JSON mode makes this rare, most likely the output was cut off
+            # at max_tokens: retry once with a larger budget
+            content = await self._complete(system_prompt, user_prompt, model=model, max_tokens=max_tokens * 2)
+            result = _extract_json(content)
+
+        if cache_path:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(json_utils.dumps_bytes(result))
+
+        return result
+
+    async def _analyze_batch(self, batch: List[str], fields: List[str]) -> Dict:
+        """
+        Analyze single batch of PRs
+
+        Args:
+            batch: List of compressed PR texts
+            fields: Fields to extract
+
+        Returns:
+            Partial analysis result
+        """
+        prs_text = "\n\n---\n\n".join(batch)
+
+        system_prompt = self._batch_system_prompt(fields)
+
+        try:
+            return await self._request_json(
+                system_prompt,
+                f"Pull Requests:\n{prs_text}",
+                model=self.batch_model,
+                max_tokens=_output_token_budget(fields, len(batch), 4000)
             )
 
-            content = response.choices[0].message.content.strip()
+        except json.JSONDecodeError as e:
+            console.print(f"[yellow]⚠️  Failed to parse JSON from LLM response: {e}[/yellow]")
+            # Return empty structure
+            return {
+                "fields": {field: [] for field in fields},
+                "partial_summary": ""
+            }
+        except Exception as e:
+            console.print(f"[red]❌ Error analyzing batch: {e}[/red]")
+            return {
+                "fields": {field: [] for field in fields},
+                "partial_summary": ""
+            }
+
+    async def _aggregate_results(self, batch_results: List[Dict], fields: List[str], total_prs: int) -> Dict:
+        """
+        Aggregate all batch results into final output
 
-            # Clean markdown code blocks if present
-            if content.startswith("```json"):
-                content = content[7:]
-            if content.startswith("```"):
-                content = content[3:]
-            if content.endswith("```"):
-                content = content[:-3]
+        Args:
+            batch_results: List of batch analysis results
+            fields: Field names
+            total_prs: Total number of PRs analyzed
 
-            result = json.loads(content.strip())
+        Returns:
+            Final aggregated result
+        """
+        all_results_text = self._format_partial_results(batch_results)
+
+        system_prompt = self._aggregate_system_prompt(fields)
+        prompt = f"""Total PRs analyzed: {total_prs}
+
+Partial Results (one JSON object per batch):
+{all_results_text}"""
+
+        try:
+            result = await self._request_json(
+                system_prompt,
+                prompt,
+                model=self.aggregate_model,
+                # Extra room for the multi-paragraph summary
+                max_tokens=_output_token_budget(fields, 10, 5000) + 1000
+            )
 
             # Ensure all fields are present
             if "fields" not in result:
@@ -328,18 +678,19 @@ The summary should:
         Returns:
             Manually aggregated result
         """
-        merged_fields = {field: [] for field in fields}
+        counters = {field: Counter() for field in fields}
 
-        # Combine all items
+        # Count all items
         for result in batch_results:
             result_fields = result.get("fields", {})
             for field in fields:
-                items = result_fields.get(field, [])
-                merged_fields[field].extend(items)
+                counters[field].update(result_fields.get(field, []))
 
-        # Remove duplicates
-        for field in fields:
-            merged_fields[field] = list(set(merged_fields[field]))
+        # Remove duplicates, most mentioned items first (ties keep first-seen order)
+        merged_fields = {
+            field: [item for item, _ in counters[field].most_common()]
+            for field in fields
+        }
 
         # Combine summaries
         summaries = [r.get("partial_summary", "") for r in batch_results if r.get("partial_summary")]
@@ -349,7 +700,3 @@ The summary should:
             "fields": merged_fields,
             "summary": combined_summary or "Analysis completed successfully."
         }
-
-
-# Need to import Path
-from pathlib import Path
\ No newline at end of file
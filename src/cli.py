@@ -6,9 +6,13 @@ Interactive command-line tool for fetching and exporting pull requests from GitH
 
 import sys
 import os
-import yaml
-from typing import Optional, List
+import re
+import time
+import hashlib
+import itertools
+from typing import Optional, List, Any, Callable
 from pathlib import Path
+from types import MappingProxyType
 
 import typer
 from rich.console import Console
@@ -17,12 +21,9 @@ from rich.prompt import Prompt, Confirm
 from rich.panel import Panel
 from rich import print as rprint
 
+from . import json_utils
 from .config import config
 from .github_api import GitHubClient, GitHubAPIError
-from .exporters import JSONExporter, CSVExporter, MarkdownExporter
-from .local_loader import LocalPRLoader
-from .ai_analyzer import GroqAnalyzer
-from .enricher import PREnricher
 
 
 app = typer.Typer(
@@ -32,6 +33,20 @@ app = typer.Typer(
 )
 console = Console()
 
+# Menu number -> PR state in interactive mode
+_STATE_MAP = MappingProxyType({
+    "1": "all",
+    "2": "open",
+    "3": "closed",
+    "4": "merged"
+})
+
+# --format values that produce per-PR JSON files (needed for --include-files)
+_FORMAT_JSON = frozenset({"json", "all"})
+
+# Split comma-separated option values, dropping whitespace around commas
+_CSV_SPLIT = re.compile(r"\s*,\s*").split
+
 
 def print_header():
     """Print CLI header"""
@@ -42,6 +57,58 @@ def print_header():
     ))
 
 
+def _export_formats(export_format: str) -> List[str]:
+    """Expand --format value (json, csv, markdown, all) to list of formats"""
+    from .exporters import MultiExporter
+
+    if export_format == "all":
+        return list(MultiExporter.FORMATS)
+    return [export_format]
+
+
+def _etag_cache_dir() -> Optional[Path]:
+    """Directory of ETag-revalidated GitHub responses, None if caching is disabled"""
+    return config.get_cache_dir() / "etags" if config.is_cache_enabled() else None
+
+
+def cached_call(key: str, fn: Callable[[], Any], use_cache: bool = True) -> Any:
+    """
+    Return cached result of fn if it is fresh, otherwise call fn and cache it
+
+    Results are stored as JSON in the cache directory and expire after
+    config.cache_ttl seconds (based on file mtime).
+
+    Args:
+        key: Unique cache key (should include everything the result depends on)
+        fn: Function producing a JSON-serializable result
+        use_cache: If False, always call fn and refresh the cache entry
+
+    Returns:
+        Result of fn
+    """
+    if not config.is_cache_enabled():
+        return fn()
+
+    cache_path = config.get_cache_dir() / "github" / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+
+    if use_cache:
+        try:
+            if time.time() - cache_path.stat().st_mtime < config.get_cache_ttl():
+                return json_utils.loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            pass  # Missing or corrupted entry
+
+    result = fn()
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(json_utils.dumps_bytes(result))
+    except OSError as e:
+        console.print(f"[dim]Could not write cache: {e}[/dim]")
+
+    return result
+
+
 def display_menu(items: List[dict], title: str, name_key: str, show_description: bool = False) -> Optional[dict]:
     """
     Display interactive menu and return selected item
@@ -71,8 +138,8 @@ def display_menu(items: List[dict], title: str, name_key: str, show_description:
     for i, item in enumerate(items, 1):
         if show_description:
             desc = item.get('description', '') or 'N/A'
-            # Truncate long descriptions
-            if len(desc) > 50:
+            # Truncate long descriptions (desc[50:] is non-empty only past 50 chars)
+            if desc[50:]:
                 desc = desc[:47] + "..."
             table.add_row(str(i), item[name_key], desc)
         else:
@@ -161,10 +228,14 @@ def select_multiple_items(items: List[dict], title: str, name_key: str) -> List[
 def interactive(
     token: Optional[str] = typer.Option(None, "--token", "-t", help="GitHub personal access token"),
     output: Optional[str] = typer.Option(None, "--output", "-o", help="Output directory"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Refresh cached organization/repository lists"),
 ):
     """
     Interactive mode - guided workflow for fetching PRs
     """
+    # Heavy modules are imported by the commands that need them
+    from .exporters import MultiExporter
+
     print_header()
 
     # Get token
@@ -176,15 +247,19 @@ def interactive(
 
     try:
         # Initialize client
-        client = GitHubClient(token)
+        client = GitHubClient(token, etag_cache_dir=_etag_cache_dir())
 
         # Get current user
         console.print("\n[cyan]🔍 Authenticating...[/cyan]")
-        user = client.get_current_user()
+        user = client.current_user
         console.print(f"[green]✅ Authenticated as: {user['login']}[/green]")
 
         # Get organizations
-        orgs = client.get_organizations()
+        orgs = cached_call(
+            f"orgs:{client.token}",
+            client.get_organizations,
+            use_cache=not no_cache
+        )
 
         if not orgs:
             console.print("[red]❌ No organizations found[/red]")
@@ -196,43 +271,66 @@ def interactive(
         selected_org = display_menu(orgs, "Organizations", "login")
         if not selected_org:
             console.print("\n[yellow]👋 Cancelled[/yellow]")
-            raise typer.Exit(0)
+            return
 
         org_name = selected_org['login']
         console.print(f"\n[green]✅ Selected: {org_name}[/green]")
 
-        # Get repositories
-        repos = client.get_repositories(org_name)
+        # Listing all repositories paginates through the whole organization,
+        # entering names costs a single request per repository
+        repo_source = Prompt.ask(
+            "\nBrowse all repositories or enter names?",
+            choices=["browse", "name"],
+            default="browse"
+        )
 
-        if not repos:
-            console.print("[red]❌ No repositories found[/red]")
-            raise typer.Exit(1)
+        if repo_source == "name":
+            names_input = Prompt.ask("Repository name(s), comma-separated")
+            repo_names = [
+                client.get_repository(org_name, name.strip())['name']
+                for name in names_input.split(",") if name.strip()
+            ]
 
-        console.print(f"[green]✅ Found {len(repos)} repositories[/green]")
+            if not repo_names:
+                console.print("\n[yellow]👋 Cancelled[/yellow]")
+                return
+        else:
+            # Get repositories
+            repos = cached_call(
+                f"repos:{client.token}:{org_name}",
+                lambda: client.get_repositories(org_name),
+                use_cache=not no_cache
+            )
 
-        # Ask: single or multiple repos
-        mode = Prompt.ask(
-            "\nSelect mode",
-            choices=["single", "multiple"],
-            default="single"
-        )
+            if not repos:
+                console.print("[red]❌ No repositories found[/red]")
+                raise typer.Exit(1)
 
-        if mode == "single":
-            # Select single repository
-            selected_repo = display_menu(repos, "Repositories", "name", show_description=True)
-            if not selected_repo:
-                console.print("\n[yellow]👋 Cancelled[/yellow]")
-                raise typer.Exit(0)
+            console.print(f"[green]✅ Found {len(repos)} repositories[/green]")
 
-            repo_names = [selected_repo['name']]
-        else:
-            # Select multiple repositories
-            selected_repos = select_multiple_items(repos, "Repositories", "name")
-            if not selected_repos:
-                console.print("\n[yellow]👋 Cancelled[/yellow]")
-                raise typer.Exit(0)
+            # Ask: single or multiple repos
+            mode = Prompt.ask(
+                "\nSelect mode",
+                choices=["single", "multiple"],
+                default="single"
+            )
+
+            if mode == "single":
+                # Select single repository
+                selected_repo = display_menu(repos, "Repositories", "name", show_description=True)
+                if not selected_repo:
+                    console.print("\n[yellow]👋 Cancelled[/yellow]")
+                    return
+
+                repo_names = [selected_repo['name']]
+            else:
+                # Select multiple repositories
+                selected_repos = select_multiple_items(repos, "Repositories", "name")
+                if not selected_repos:
+                    console.print("\n[yellow]👋 Cancelled[/yellow]")
+                    return
 
-            repo_names = [repo['name'] for repo in selected_repos]
+                repo_names = [repo['name'] for repo in selected_repos]
 
         console.print(f"\n[green]✅ Selected {len(repo_names)} repository(ies)[/green]")
 
@@ -249,22 +347,15 @@ def interactive(
 
         state_input = Prompt.ask("Select state(s)", default="1")
 
-        state_mapping = {
-            "1": "all",
-            "2": "open",
-            "3": "closed",
-            "4": "merged"
-        }
-
         # Parse state selection
         if state_input == "1":
             state = "all"
         else:
-            selected_numbers = [n.strip() for n in state_input.split(",")]
+            selected_numbers = _CSV_SPLIT(state_input.strip())
             selected_states = []
             for num in selected_numbers:
-                if num in state_mapping:
-                    selected_states.append(state_mapping[num])
+                if num in _STATE_MAP:
+                    selected_states.append(_STATE_MAP[num])
 
             if len(selected_states) == 1:
                 state = selected_states[0]
@@ -306,7 +397,8 @@ def interactive(
         # Fetch PRs
         if len(repo_names) == 1:
             # Single repository
-            prs = client.get_pull_requests(
+            # PRs are streamed to the exporter as pages arrive
+            prs = client.iter_pull_requests(
                 org_name,
                 repo_names[0],
                 user['login'],
@@ -316,28 +408,20 @@ def interactive(
                 merged_only=merged_only
             )
 
-            if not prs:
+            first_pr = next(prs, None)
+            if first_pr is None:
                 console.print("[yellow]⚠️  No PRs found[/yellow]")
-                raise typer.Exit(0)
-
-            console.print(f"\n[green]✅ Found {len(prs)} PRs[/green]")
-
-            # Export
-            if export_format in ["json", "all"]:
-                exporter = JSONExporter(output_path)
-                exporter.export(prs, org_name, repo_names[0])
+                return
 
-            if export_format in ["csv", "all"]:
-                exporter = CSVExporter(output_path)
-                exporter.export(prs, org_name, repo_names[0])
+            # Export (all selected formats in one pass)
+            exporter = MultiExporter(output_path, _export_formats(export_format))
+            count = exporter.export(itertools.chain([first_pr], prs), org_name, repo_names[0])
 
-            if export_format in ["markdown", "all"]:
-                exporter = MarkdownExporter(output_path)
-                exporter.export(prs, org_name, repo_names[0])
+            console.print(f"\n[green]✅ Found {count} PRs[/green]")
 
         else:
             # Multiple repositories
-            repo_prs = client.get_pull_requests_from_multiple_repos(
+            repo_prs, total_prs = client.get_pull_requests_from_multiple_repos(
                 org_name,
                 repo_names,
                 user['login'],
@@ -347,26 +431,15 @@ def interactive(
                 merged_only=merged_only
             )
 
-            total_prs = sum(len(prs) for prs in repo_prs.values())
-
             if total_prs == 0:
                 console.print("[yellow]⚠️  No PRs found[/yellow]")
-                raise typer.Exit(0)
+                return
 
             console.print(f"\n[green]✅ Found {total_prs} PRs across {len(repo_names)} repositories[/green]")
 
-            # Export
-            if export_format in ["json", "all"]:
-                exporter = JSONExporter(output_path)
-                exporter.export_multiple(repo_prs, org_name)
-
-            if export_format in ["csv", "all"]:
-                exporter = CSVExporter(output_path)
-                exporter.export_multiple(repo_prs, org_name)
-
-            if export_format in ["markdown", "all"]:
-                exporter = MarkdownExporter(output_path)
-                exporter.export_multiple(repo_prs, org_name)
+            # Export (all selected formats in one pass)
+            exporter = MultiExporter(output_path, _export_formats(export_format))
+            exporter.export_multiple(repo_prs, org_name)
 
         console.print(f"\n[green]🎉 Done! Check {output_path} for exported data[/green]")
 
@@ -375,7 +448,7 @@ def interactive(
         raise typer.Exit(1)
     except KeyboardInterrupt:
         console.print("\n\n[yellow]👋 Cancelled by user[/yellow]")
-        raise typer.Exit(0)
+        return
     except Exception as e:
         console.print(f"\n[red]❌ Unexpected error: {e}[/red]")
         raise typer.Exit(1)
@@ -392,10 +465,14 @@ def fetch(
     output: str = typer.Option("./github_prs", "--output", "-o", help="Output directory"),
     token: Optional[str] = typer.Option(None, "--token", "-t", help="GitHub personal access token"),
     include_files: bool = typer.Option(False, "--include-files", help="Fetch and include file change data for each PR"),
+    no_patches: bool = typer.Option(False, "--no-patches", help="With --include-files: skip diff patches and fetch file lists with batched GraphQL queries"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Refresh cached repository list"),
 ):
     """
     Fetch PRs from specific organization/repository (non-interactive)
     """
+    from .exporters import MultiExporter
+
     print_header()
 
     # Get token
@@ -407,17 +484,16 @@ def fetch(
 
     try:
         # Initialize client
-        client = GitHubClient(token)
+        client = GitHubClient(token, etag_cache_dir=_etag_cache_dir())
 
-        # Get current user
-        user = client.get_current_user()
-        pr_author = author or user['login']
+        # Default to authenticated user (skips the /user request when --author is given)
+        pr_author = author if author else client.current_user['login']
 
         console.print(f"[cyan]🔍 Fetching PRs by {pr_author} from {org}[/cyan]")
 
         # Parse state (support comma-separated values)
         if "," in state:
-            parsed_state = [s.strip() for s in state.split(",")]
+            parsed_state = _CSV_SPLIT(state.strip())
         else:
             parsed_state = state
 
@@ -425,44 +501,45 @@ def fetch(
 
         if repo:
             # Single repository
-            prs = client.get_pull_requests(org, repo, pr_author, parsed_state, merged_only=merged_only)
+            # PRs are streamed to the exporter as pages arrive
+            prs = client.iter_pull_requests(org, repo, pr_author, parsed_state, merged_only=merged_only)
 
-            if not prs:
+            first_pr = next(prs, None)
+            if first_pr is None:
                 console.print("[yellow]⚠️  No PRs found[/yellow]")
-                raise typer.Exit(0)
+                return
 
-            console.print(f"[green]✅ Found {len(prs)} PRs[/green]")
+            prs = itertools.chain([first_pr], prs)
 
-            # Export
-            if format in ["json", "all"]:
-                exporter = JSONExporter(output_path)
-                exporter.export(prs, org, repo)
-
-            if format in ["csv", "all"]:
-                exporter = CSVExporter(output_path)
-                exporter.export(prs, org, repo)
+            # Enrich with file data if requested (before export, so files are written once)
+            enrich_stats = None
+            if include_files and format in _FORMAT_JSON:
+                console.print(f"\n[cyan]📂 Enriching PRs with file data...[/cyan]")
+                from .enricher import PREnricher
+                enricher = PREnricher(client, include_patches=not no_patches)
+                enrich_stats = {}
+                prs = enricher.enrich_in_memory(prs, org, repo, enrich_stats)
 
-            if format in ["markdown", "all"]:
-                exporter = MarkdownExporter(output_path)
-                exporter.export(prs, org, repo)
+            # Export (all selected formats in one pass)
+            exporter = MultiExporter(output_path, _export_formats(format))
+            count = exporter.export(prs, org, repo)
 
-            # Enrich with file data if requested
-            if include_files and format in ["json", "all"]:
-                console.print(f"\n[cyan]📂 Enriching PRs with file data...[/cyan]")
-                enricher = PREnricher(client)
-                repo_path = output_path / org / repo
-                stats = enricher.enrich_directory(repo_path, org, repo)
+            console.print(f"[green]✅ Found {count} PRs[/green]")
 
-                if stats:
-                    console.print(f"\n[green]✅ Enrichment complete:[/green]")
-                    console.print(f"  Enriched: {stats.get('enriched', 0)}/{stats.get('total', 0)} PRs")
+            if enrich_stats:
+                console.print(f"\n[green]✅ Enrichment complete:[/green]")
+                console.print(f"  Enriched: {enrich_stats.get('enriched', 0)}/{enrich_stats.get('total', 0)} PRs")
 
         else:
             # All repositories in organization
-            repos = client.get_repositories(org)
+            repos = cached_call(
+                f"repos:{client.token}:{org}",
+                lambda: client.get_repositories(org),
+                use_cache=not no_cache
+            )
             repo_names = [r['name'] for r in repos]
 
-            repo_prs = client.get_pull_requests_from_multiple_repos(
+            repo_prs, total_prs = client.get_pull_requests_from_multiple_repos(
                 org,
                 repo_names,
                 pr_author,
@@ -470,37 +547,32 @@ def fetch(
                 merged_only=merged_only
             )
 
-            total_prs = sum(len(prs) for prs in repo_prs.values())
-
             if total_prs == 0:
                 console.print("[yellow]⚠️  No PRs found[/yellow]")
-                raise typer.Exit(0)
+                return
 
             console.print(f"[green]✅ Found {total_prs} PRs[/green]")
 
-            # Export
-            if format in ["json", "all"]:
-                exporter = JSONExporter(output_path)
-                exporter.export_multiple(repo_prs, org)
-
-            if format in ["csv", "all"]:
-                exporter = CSVExporter(output_path)
-                exporter.export_multiple(repo_prs, org)
-
-            if format in ["markdown", "all"]:
-                exporter = MarkdownExporter(output_path)
-                exporter.export_multiple(repo_prs, org)
-
-            # Enrich with file data if requested
-            if include_files and format in ["json", "all"]:
+            # Enrich with file data if requested (before export, so files are written once)
+            enrich_stats = None
+            if include_files and format in _FORMAT_JSON:
                 console.print(f"\n[cyan]📂 Enriching PRs with file data...[/cyan]")
-                enricher = PREnricher(client)
-                org_path = output_path / org
-                stats = enricher.enrich_organization(org_path, org)
-
-                if stats:
-                    console.print(f"\n[green]✅ Enrichment complete:[/green]")
-                    console.print(f"  Enriched: {stats.get('enriched', 0)}/{stats.get('total', 0)} PRs across {stats.get('repositories', 0)} repositories")
+                from .enricher import PREnricher
+                enricher = PREnricher(client, include_patches=not no_patches)
+                enrich_stats = {}
+                repo_prs = {
+                    repo_name: list(enricher.enrich_in_memory(prs, org, repo_name, enrich_stats))
+                    for repo_name, prs in repo_prs.items()
+                }
+
+            # Export (all selected formats in one pass)
+            exporter = MultiExporter(output_path, _export_formats(format))
+            exporter.export_multiple(repo_prs, org)
+
+            if enrich_stats:
+                repos_with_prs = sum(1 for prs in repo_prs.values() if prs)
+                console.print(f"\n[green]✅ Enrichment complete:[/green]")
+                console.print(f"  Enriched: {enrich_stats.get('enriched', 0)}/{enrich_stats.get('total', 0)} PRs across {repos_with_prs} repositories")
 
         console.print(f"\n[green]🎉 Done! Check {output_path} for exported data[/green]")
 
@@ -552,14 +624,23 @@ def analyze(
     input_path: str = typer.Argument(..., help="Path to directory with PR JSON files"),
     fields: Optional[str] = typer.Option(None, "--fields", "-f", help="Comma-separated list of fields to fill"),
     batch_size: int = typer.Option(15, "--batch-size", "-b", help="Number of PRs per batch"),
+    batch_tokens: Optional[int] = typer.Option(None, "--batch-tokens", help="Pack batches up to this many estimated input tokens (overrides --batch-size)"),
+    concurrency: int = typer.Option(4, "--concurrency", "-c", help="Maximum number of batches analyzed in parallel"),
+    batch_model: str = typer.Option("llama-3.1-8b-instant", "--batch-model", help="Groq model for per-batch analysis"),
+    aggregate_model: str = typer.Option("llama-3.3-70b-versatile", "--aggregate-model", help="Groq model for final aggregation"),
     output: str = typer.Option("resume.yaml", "--output", "-o", help="Output file path"),
     format: str = typer.Option("yaml", "--format", help="Output format: yaml, json"),
     groq_key: Optional[str] = typer.Option(None, "--groq-key", help="Groq API key"),
     recursive: bool = typer.Option(False, "--recursive", "-r", help="Search subdirectories recursively"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Do not reuse cached AI responses from previous runs"),
+    debug: bool = typer.Option(False, "--debug", help="Print full traceback on errors"),
 ):
     """
     Analyze PRs from local files and generate AI-powered resume
     """
+    from .local_loader import LocalPRLoader
+    from .ai_analyzer import GroqAnalyzer
+
     print_header()
 
     # Get Groq API key
@@ -578,7 +659,7 @@ def analyze(
 
         if not prs:
             console.print("[yellow]⚠️  No PRs found in the specified directory[/yellow]")
-            raise typer.Exit(0)
+            return
 
         console.print(f"[green]✅ Loaded {len(prs)} PRs[/green]")
 
@@ -610,18 +691,24 @@ def analyze(
                 fields_list = default_fields
             else:
                 custom_fields = Prompt.ask("Enter comma-separated field names")
-                fields_list = [f.strip() for f in custom_fields.split(",")]
+                fields_list = _CSV_SPLIT(custom_fields.strip())
         else:
-            fields_list = [f.strip() for f in fields.split(",")]
+            fields_list = _CSV_SPLIT(fields.strip())
 
         console.print(f"\n[green]✅ Fields to analyze: {', '.join(fields_list)}[/green]")
 
         # Initialize Groq analyzer
-        console.print(f"\n[cyan]🤖 Initializing AI analyzer (model: llama-3.3-70b-versatile)...[/cyan]")
-        analyzer = GroqAnalyzer(api_key=groq_key)
+        console.print(f"\n[cyan]🤖 Initializing AI analyzer (models: {batch_model} / {aggregate_model})...[/cyan]")
+        analyzer = GroqAnalyzer(
+            api_key=groq_key,
+            batch_model=batch_model,
+            aggregate_model=aggregate_model,
+            max_concurrency=concurrency,
+            cache_dir=None if no_cache or not config.is_cache_enabled() else config.get_cache_dir() / "llm"
+        )
 
         # Analyze PRs
-        result = analyzer.analyze_prs(prs, fields_list, batch_size)
+        result = analyzer.analyze_prs(prs, fields_list, batch_size, max_batch_tokens=batch_tokens)
 
         # Prepare output
         output_data = {
@@ -639,12 +726,20 @@ def analyze(
         output_path = Path(output)
 
         if format == "yaml":
+            import yaml
+            # LibYAML-based dumper is much faster when PyYAML was built with it
+            dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
             with open(output_path, 'w', encoding='utf-8') as f:
-                yaml.dump(output_data, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
+                yaml.dump(
+                    output_data,
+                    f,
+                    Dumper=dumper,
+                    allow_unicode=True,
+                    default_flow_style=False,
+                    sort_keys=False
+                )
         else:  # json
-            import json
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, indent=2, ensure_ascii=False)
+            output_path.write_bytes(json_utils.dumps_bytes(output_data, indent=True))
 
         console.print(f"\n[green]🎉 Resume generated successfully![/green]")
         console.print(f"[green]📄 Saved to: {output_path}[/green]")
@@ -662,8 +757,9 @@ def analyze(
         raise typer.Exit(1)
     except Exception as e:
         console.print(f"[red]❌ Error: {e}[/red]")
-        import traceback
-        traceback.print_exc()
+        if debug:
+            import traceback
+            traceback.print_exc()
         raise typer.Exit(1)
 
 
@@ -674,10 +770,14 @@ def enrich(
     repo: Optional[str] = typer.Option(None, "--repo", "-r", help="Repository name (if not specified, processes all repos in org)"),
     token: Optional[str] = typer.Option(None, "--token", "-t", help="GitHub personal access token"),
     recursive: bool = typer.Option(False, "--recursive", help="Process subdirectories recursively"),
+    no_patches: bool = typer.Option(False, "--no-patches", help="Skip diff patches and fetch file lists with batched GraphQL queries (far fewer requests)"),
+    debug: bool = typer.Option(False, "--debug", help="Print full traceback on errors"),
 ):
     """
     Enrich existing PR JSON files with file change data from GitHub API
     """
+    from .enricher import PREnricher
+
     print_header()
 
     # Get token
@@ -689,15 +789,16 @@ def enrich(
 
     try:
         # Initialize GitHub client
-        client = GitHubClient(token)
+        client = GitHubClient(token, etag_cache_dir=_etag_cache_dir())
         console.print(f"\n[cyan]🔐 Authenticated with GitHub[/cyan]")
 
-        # Check rate limit
-        remaining, reset = client.get_rate_limit_status()
+        # Check rate limit (GraphQL has its own bucket)
+        rate_resource = "graphql" if no_patches else "core"
+        remaining, reset = client.get_rate_limit_status(rate_resource)
         console.print(f"[cyan]📊 Rate limit: {remaining} requests remaining[/cyan]")
 
         # Initialize enricher
-        enricher = PREnricher(client)
+        enricher = PREnricher(client, include_patches=not no_patches)
 
         input_dir = Path(input_path)
 
@@ -726,7 +827,7 @@ def enrich(
             console.print(f"  📁 Repositories processed: {stats['repositories']}")
 
         # Final rate limit check
-        remaining_after, _ = client.get_rate_limit_status()
+        remaining_after, _ = client.get_rate_limit_status(rate_resource, max_age=0)
         used = remaining - remaining_after
         console.print(f"\n[cyan]📊 API requests used: {used}[/cyan]")
         console.print(f"[cyan]📊 Rate limit remaining: {remaining_after}[/cyan]")
@@ -741,8 +842,9 @@ def enrich(
         raise typer.Exit(1)
     except Exception as e:
         console.print(f"\n[red]❌ Error: {e}[/red]")
-        import traceback
-        traceback.print_exc()
+        if debug:
+            import traceback
+            traceback.print_exc()
         raise typer.Exit(1)
 
 
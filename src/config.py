@@ -6,6 +6,31 @@ import os
 from pathlib import Path
 from typing import Optional
 from dotenv import load_dotenv
+from rich.console import Console
+from rich.markup import escape
+
+
+console = Console()
+
+
+# .env is parsed once per process, not once per Config instance
+_DOTENV_LOADED = False
+
+# Cache lifetime in seconds when CACHE_TTL is not set or invalid
+DEFAULT_CACHE_TTL = 300
+
+
+def _parse_cache_ttl(value: Optional[str]) -> int:
+    """Parse CACHE_TTL, falling back to DEFAULT_CACHE_TTL (with a warning) if invalid"""
+    if value is None:
+        return DEFAULT_CACHE_TTL
+    try:
+        return int(value)
+    except ValueError:
+        console.print(
+            f"[yellow]⚠️  Invalid CACHE_TTL '{escape(value)}', using {DEFAULT_CACHE_TTL} seconds[/yellow]"
+        )
+        return DEFAULT_CACHE_TTL
 
 
 class Config:
@@ -13,12 +38,20 @@ class Config:
 
     def __init__(self):
         # Load environment variables from .env file
-        load_dotenv()
+        global _DOTENV_LOADED
+        if not _DOTENV_LOADED:
+            load_dotenv()
+            _DOTENV_LOADED = True
 
         self.github_token: Optional[str] = os.getenv("GITHUB_TOKEN")
         self.default_output_dir: str = os.getenv("OUTPUT_DIR", "./github_prs")
         self.cache_enabled: bool = os.getenv("CACHE_ENABLED", "true").lower() == "true"
         self.cache_dir: str = os.getenv("CACHE_DIR", "./.cache")
+        self.cache_ttl: int = _parse_cache_ttl(os.getenv("CACHE_TTL"))
+
+        # Path objects are built once and reused by the getters
+        self._output_dir_path = Path(self.default_output_dir)
+        self._cache_dir_path = Path(self.cache_dir)
 
     def get_token(self) -> str:
         """Get GitHub token or raise error if not set"""
@@ -34,20 +67,25 @@ class Config:
 
     def get_output_dir(self) -> Path:
         """Get output directory as Path object"""
-        return Path(self.default_output_dir)
+        return self._output_dir_path
 
     def set_output_dir(self, path: str):
         """Set output directory"""
         self.default_output_dir = path
+        self._output_dir_path = Path(path)
 
     def get_cache_dir(self) -> Path:
         """Get cache directory as Path object"""
-        return Path(self.cache_dir)
+        return self._cache_dir_path
 
     def is_cache_enabled(self) -> bool:
         """Check if caching is enabled"""
         return self.cache_enabled
 
+    def get_cache_ttl(self) -> int:
+        """Get cache lifetime in seconds for GitHub listings"""
+        return self.cache_ttl
+
 
 # Global config instance
 config = Config()
\ No newline at end of file
@@ -3,26 +3,81 @@ PR Enricher
 Enriches existing PR JSON files with file change data from GitHub API
 """
 
-import json
+import os
+import itertools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict
+from typing import Any, List, Dict, Iterable, Iterator, Optional, Tuple
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TaskID
 
-from .github_api import GitHubClient
-from .local_loader import LocalPRLoader
+from . import json_utils
+from .github_api import GitHubClient, GitHubAPIError
 
 
 console = Console()
 
+# Extensions whose diffs are not useful for analysis
+_BINARY_EXTS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.pdf', '.zip', '.gz', '.bin', '.woff', '.woff2', '.ico'})
+
+
+def _scan_pr_file(path: Path) -> Tuple[bool, Any]:
+    """
+    Parse PR file for the enrichment pre-scan
+
+    Returns:
+        (True, PR number) if the file already has file data,
+        otherwise (False, parsed PR data or None if unreadable)
+    """
+    try:
+        data = json_utils.loads(path.read_bytes())
+        if 'files' in data and data['files']:
+            return True, data.get('number', '?')
+        return False, data
+    except Exception:
+        return False, None
+
 
 class PREnricher:
     """Enrich PR data with file information"""
 
-    def __init__(self, github_client: GitHubClient):
+    # PRs per GraphQL query when patches are not needed
+    GRAPHQL_BATCH_SIZE = 25
+
+    # Sidecar file in each enriched directory: relative PR file path -> mtime (ns)
+    INDEX_FILENAME = ".enriched.index"
+
+    def __init__(self, github_client: GitHubClient, max_workers: int = 8, include_patches: bool = True):
+        """
+        Args:
+            github_client: Authenticated GitHub client
+            max_workers: Maximum number of PRs enriched at once
+            include_patches: Include diff patches of small files. Patches are only
+                available from the REST API (one request per PR); without them
+                enrich_directory fetches file lists with batched GraphQL queries.
+        """
         self.client = github_client
+        self.max_workers = max_workers
+        self.include_patches = include_patches
 
-    def enrich_pr_file(self, pr_file_path: Path, owner: str, repo: str) -> bool:
+    def _get_workers(self, pending: int, resource: str = "core") -> int:
+        """
+        Number of worker threads for pending jobs, limited by rate limit headroom
+
+        Each job (a PR, or a GraphQL batch of PRs) needs at least one request.
+        """
+        workers = min(self.max_workers, pending)
+        if workers <= 1:
+            return 1
+
+        try:
+            remaining, _ = self.client.get_rate_limit_status(resource)
+        except GitHubAPIError:
+            return 1
+
+        return max(1, min(workers, remaining))
+
+    def enrich_pr_file(self, pr_file_path: Path, owner: str, repo: str, pr_data: Optional[Dict] = None) -> bool:
         """
         Enrich a single PR JSON file with file data
 
@@ -30,14 +85,15 @@ class PREnricher:
             pr_file_path: Path to PR JSON file
             owner: Repository owner
             repo: Repository name
+            pr_data: Already parsed content of the file (read from disk if not given)
 
         Returns:
             True if enriched successfully, False otherwise
         """
         try:
             # Read existing PR data
-            with open(pr_file_path, 'r', encoding='utf-8') as f:
-                pr_data = json.load(f)
+            if pr_data is None:
+                pr_data = json_utils.loads(pr_file_path.read_bytes())
 
             # Skip if already has files
             if 'files' in pr_data and pr_data['files']:
@@ -49,44 +105,145 @@ class PREnricher:
                 console.print(f"[yellow]  ⚠️  No PR number in {pr_file_path.name}[/yellow]")
                 return False
 
-            # Fetch files from GitHub API
-            files = self.client.get_pr_files(owner, repo, pr_number)
-
-            # Simplify file data (keep only essential fields + patch for analysis)
-            simplified_files = []
-            for file in files:
-                simplified = {
-                    'filename': file.get('filename'),
-                    'status': file.get('status'),
-                    'additions': file.get('additions', 0),
-                    'deletions': file.get('deletions', 0),
-                    'changes': file.get('changes', 0)
-                }
-
-                # Include patch for small files (< 500 changes) to improve AI analysis
-                # Skip binary files and very large diffs
-                patch = file.get('patch')
-                changes = file.get('changes', 0)
+            previous = pr_data.get('files')
+            self._add_files(pr_data, owner, repo)
+
+            # Save updated PR data (unless file data is unchanged, e.g. an empty list again)
+            if pr_data['files'] != previous or 'files_count' not in pr_data:
+                self._write_pr_data(pr_file_path, pr_data)
+
+            return True
+
+        except Exception as e:
+            console.print(f"[red]  ❌ Error enriching {pr_file_path.name}: {e}[/red]")
+            return False
 
-                if patch and changes < 500:
+    def _add_files(self, pr_data: Dict, owner: str, repo: str):
+        """Fetch files of PR from GitHub API and add them to pr_data"""
+        self._set_files(pr_data, self.client.get_pr_files(owner, repo, pr_data['number']))
+
+    def _set_files(self, pr_data: Dict, files: List[Dict]):
+        """Add simplified file data to pr_data"""
+        # Simplify file data (keep only essential fields + patch for analysis)
+        simplified_files = []
+        for file in files:
+            filename = file.get('filename')
+            changes = file.get('changes', 0)
+            simplified = {
+                'filename': filename,
+                'status': file.get('status'),
+                'additions': file.get('additions', 0),
+                'deletions': file.get('deletions', 0),
+                'changes': changes
+            }
+
+            # Include patch for small files (< 500 changes) to improve AI analysis
+            # Skip removed and binary files and very large diffs before touching the patch
+            if (
+                changes < 500
+                and file.get('status') != 'removed'
+                and os.path.splitext(filename or '')[1].lower() not in _BINARY_EXTS
+            ):
+                patch = file.get('patch')
+                if patch:
                     # Limit patch size to 1500 chars to keep JSON compact
                     simplified['patch'] = patch[:1500]
 
-                simplified_files.append(simplified)
+            simplified_files.append(simplified)
 
-            # Add files to PR data
-            pr_data['files'] = simplified_files
-            pr_data['files_count'] = len(simplified_files)
+        # Add files to PR data
+        pr_data['files'] = simplified_files
+        pr_data['files_count'] = len(simplified_files)
 
-            # Save updated PR data
-            with open(pr_file_path, 'w', encoding='utf-8') as f:
-                json.dump(pr_data, f, indent=2, ensure_ascii=False)
+    def enrich_in_memory(
+        self,
+        prs: Iterable[Dict],
+        owner: str,
+        repo: str,
+        stats: Optional[Dict] = None
+    ) -> Iterator[Dict]:
+        """
+        Enrich PR dictionaries with file data before they are exported
 
-            return True
+        PRs are enriched concurrently in windows of a few batches and yielded
+        in input order, so a stream of PRs is consumed lazily and each PR file
+        is written only once by the exporter. Without patches, each batch is a
+        single GraphQL query for up to GRAPHQL_BATCH_SIZE PRs.
 
-        except Exception as e:
-            console.print(f"[red]  ❌ Error enriching {pr_file_path.name}: {e}[/red]")
-            return False
+        Args:
+            prs: PR dictionaries (list or iterator)
+            owner: Repository owner
+            repo: Repository name
+            stats: Optional dictionary updated with total/enriched/skipped/failed counts
+
+        Yields:
+            PR dictionaries with 'files' and 'files_count' added
+        """
+        if stats is None:
+            stats = {}
+        for key in ("total", "enriched", "skipped", "failed"):
+            stats.setdefault(key, 0)
+
+        def enrich(pr_data: Dict) -> str:
+            """Enrich single PR, return stats key for the outcome"""
+            if 'files' in pr_data and pr_data['files']:
+                return "skipped"
+
+            try:
+                self._add_files(pr_data, owner, repo)
+                return "enriched"
+            except Exception as e:
+                console.print(f"[red]  ❌ Error enriching PR #{pr_data.get('number', '?')}: {e}[/red]")
+                return "failed"
+
+        def enrich_batch(batch: List[Dict]) -> List[str]:
+            """Enrich batch of PRs with one GraphQL query, return stats keys for the outcomes"""
+            todo = [pr_data for pr_data in batch if not pr_data.get('files') and pr_data.get('number')]
+            files_by_number = {}
+            if todo:
+                try:
+                    files_by_number = self.client.get_pr_files_batch(
+                        owner, repo, [pr_data['number'] for pr_data in todo], batch_size=len(todo)
+                    )
+                except Exception as e:
+                    console.print(f"[red]  ❌ Error enriching PRs of {owner}/{repo}: {e}[/red]")
+
+            outcomes = []
+            for pr_data in batch:
+                if pr_data.get('files'):
+                    outcomes.append("skipped")
+                elif pr_data.get('number') in files_by_number:
+                    self._set_files(pr_data, files_by_number[pr_data['number']])
+                    outcomes.append("enriched")
+                else:
+                    outcomes.append("failed")
+            return outcomes
+
+        if self.include_patches:
+            workers = self._get_workers(self.max_workers)
+            batch_size = 1
+        else:
+            workers = self._get_workers(self.max_workers, resource="graphql")
+            batch_size = self.GRAPHQL_BATCH_SIZE
+        prs = iter(prs)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while True:
+                window = list(itertools.islice(prs, workers * 4 * batch_size))
+                if not window:
+                    break
+
+                stats["total"] += len(window)
+
+                if self.include_patches:
+                    outcomes = executor.map(enrich, window)
+                else:
+                    batches = [window[start:start + batch_size] for start in range(0, len(window), batch_size)]
+                    outcomes = itertools.chain.from_iterable(executor.map(enrich_batch, batches))
+
+                for pr_data, outcome in zip(window, outcomes):
+                    stats[outcome] += 1
+                    yield pr_data
 
     def enrich_directory(self, directory: Path, owner: str, repo: str, recursive: bool = False) -> Dict:
         """
@@ -101,29 +258,68 @@ class PREnricher:
         Returns:
             Statistics dictionary
         """
-        loader = LocalPRLoader(directory)
+        return self._enrich_directories([(directory, repo)], owner, recursive)
 
-        # Find all PR files
+    def _find_pr_files(self, directory: Path, recursive: bool) -> List[Path]:
+        """Find pr_*.json files (names are filtered before any Path is built)"""
         if recursive:
-            pattern = "**/*.json"
-        else:
-            pattern = "*.json"
+            return [
+                Path(root) / name
+                for root, _, names in os.walk(directory)
+                for name in names
+                if name.startswith("pr_") and name.endswith(".json")
+            ]
+
+        with os.scandir(directory) as entries:
+            return [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.startswith("pr_") and entry.name.endswith(".json")
+                and entry.is_file(follow_symlinks=False)
+            ]
+
+    def _enrich_directories(
+        self,
+        targets: List[Tuple[Path, Optional[str]]],
+        owner: str,
+        recursive: bool = False
+    ) -> Dict:
+        """
+        Enrich PR files of one or more directories
+
+        Local files are scanned first, then the PRs still missing file data
+        from all directories share one worker pool, so small repositories
+        don't leave workers idle.
+
+        Args:
+            targets: (directory, repository name or None to extract from path) pairs
+            owner: Repository owner
+            recursive: Search subdirectories
 
-        pr_files = list(directory.glob(pattern))
-        pr_files = [f for f in pr_files if f.name.startswith("pr_")]
+        Returns:
+            Statistics dictionary
+        """
+        work = [(directory, repo, self._find_pr_files(directory, recursive)) for directory, repo in targets]
+        total = sum(len(pr_files) for _, _, pr_files in work)
 
-        if not pr_files:
-            console.print(f"[yellow]⚠️  No PR files found in {directory}[/yellow]")
+        if not total:
+            location = targets[0][0] if len(targets) == 1 else targets[0][0].parent
+            console.print(f"[yellow]⚠️  No PR files found in {location}[/yellow]")
             return {"total": 0, "enriched": 0, "skipped": 0, "failed": 0}
 
         stats = {
-            "total": len(pr_files),
+            "total": total,
             "enriched": 0,
             "skipped": 0,
             "failed": 0
         }
 
-        console.print(f"\n[cyan]📂 Found {len(pr_files)} PR files[/cyan]")
+        console.print(f"\n[cyan]📂 Found {total} PR files[/cyan]")
+
+        # Per directory index of files confirmed enriched on a previous run
+        # (skipped by mtime without opening them), and files confirmed now
+        indexes: Dict[Path, Dict[str, int]] = {}
+        confirmed: List[Tuple[Path, Path]] = []
 
         with Progress(
             SpinnerColumn(),
@@ -134,57 +330,200 @@ class PREnricher:
         ) as progress:
             task = progress.add_task(
                 "[cyan]Enriching PRs...",
-                total=len(pr_files)
+                total=total
             )
 
-            for pr_file in pr_files:
-                # Try to extract repo from path if not provided
-                current_repo = repo
-                if not current_repo:
-                    # Assume structure: .../org/repo/pr_123.json
-                    if len(pr_file.parts) >= 2:
-                        current_repo = pr_file.parts[-2]
-
-                if not current_repo:
-                    console.print(f"[yellow]⚠️  Cannot determine repo for {pr_file.name}[/yellow]")
-                    stats["failed"] += 1
-                    progress.update(task, advance=1)
-                    continue
-
-                # Read PR to get number for progress
-                try:
-                    with open(pr_file, 'r', encoding='utf-8') as f:
-                        pr_data = json.load(f)
-                    pr_number = pr_data.get('number', '?')
-
-                    # Check if already enriched
-                    if 'files' in pr_data and pr_data['files']:
-                        stats["skipped"] += 1
-                        progress.update(
-                            task,
-                            advance=1,
-                            description=f"[dim]PR #{pr_number} (already enriched)[/dim]"
-                        )
+            # Files still to be parsed as (directory, file, repo) tuples
+            candidates = []
+
+            for directory, repo, pr_files in work:
+                index = indexes[directory] = self._load_index(directory / self.INDEX_FILENAME)
+
+                for pr_file in pr_files:
+                    try:
+                        if index.get(pr_file.relative_to(directory).as_posix()) == pr_file.stat().st_mtime_ns:
+                            stats["skipped"] += 1
+                            progress.update(task, advance=1)
+                            continue
+                    except OSError:
+                        pass
+
+                    # Try to extract repo from path if not provided
+                    current_repo = repo
+                    if not current_repo:
+                        # Assume structure: .../org/repo/pr_123.json
+                        if len(pr_file.parts) >= 2:
+                            current_repo = pr_file.parts[-2]
+
+                    if not current_repo:
+                        console.print(f"[yellow]⚠️  Cannot determine repo for {pr_file.name}[/yellow]")
+                        stats["failed"] += 1
+                        progress.update(task, advance=1)
                         continue
 
-                except Exception:
-                    pr_number = '?'
+                    candidates.append((directory, pr_file, current_repo))
+
+            # Read PRs to check if already enriched; parsed data of pending
+            # PRs is kept so they are not read again
+            pending = []
+            file_dirs: Dict[Path, Path] = {}
+
+            for directory, pr_file, current_repo in candidates:
+                enriched, result = _scan_pr_file(pr_file)
+                if enriched:
+                    stats["skipped"] += 1
+                    confirmed.append((directory, pr_file))
+                    progress.update(
+                        task,
+                        advance=1,
+                        description=f"[dim]PR #{result} (already enriched)[/dim]"
+                    )
+                    continue
 
-                progress.update(
-                    task,
-                    description=f"[cyan]Enriching PR #{pr_number}..."
-                )
+                pending.append((pr_file, current_repo, result))
+                file_dirs[pr_file] = directory
 
-                success = self.enrich_pr_file(pr_file, owner, current_repo)
+            if pending:
+                # File requests are network-bound, so PRs are enriched concurrently
+                progress.update(task, description="[cyan]Enriching PRs...")
 
-                if success:
-                    stats["enriched"] += 1
+                if not self.include_patches:
+                    for pr_file in self._enrich_batched(pending, owner, stats, progress, task):
+                        confirmed.append((file_dirs[pr_file], pr_file))
                 else:
-                    stats["failed"] += 1
+                    with ThreadPoolExecutor(max_workers=self._get_workers(len(pending))) as executor:
+                        futures = {
+                            executor.submit(self.enrich_pr_file, pr_file, owner, current_repo, pr_data): pr_file
+                            for pr_file, current_repo, pr_data in pending
+                        }
+
+                        for future in as_completed(futures):
+                            if future.result():
+                                stats["enriched"] += 1
+                                pr_file = futures[future]
+                                confirmed.append((file_dirs[pr_file], pr_file))
+                            else:
+                                stats["failed"] += 1
+
+                            progress.update(task, advance=1)
+
+        # Record confirmed files in the directory indexes
+        updated = set()
+        for directory, pr_file in confirmed:
+            try:
+                indexes[directory][pr_file.relative_to(directory).as_posix()] = pr_file.stat().st_mtime_ns
+                updated.add(directory)
+            except OSError:
+                pass
+
+        for directory in updated:
+            self._save_index(directory / self.INDEX_FILENAME, indexes[directory])
+
+        return stats
+
+    def _load_index(self, index_path: Path) -> Dict[str, int]:
+        """Load enriched files index (relative path -> mtime in ns), empty if missing or corrupted"""
+        try:
+            index = json_utils.loads(index_path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    def _save_index(self, index_path: Path, index: Dict[str, int]):
+        """Save enriched files index"""
+        try:
+            index_path.write_bytes(json_utils.dumps_bytes(index))
+        except OSError as e:
+            console.print(f"[dim]Could not write {index_path}: {e}[/dim]")
+
+    def _enrich_batched(
+        self,
+        pending: List[Tuple[Path, str, Optional[Dict]]],
+        owner: str,
+        stats: Dict,
+        progress: Progress,
+        task: TaskID
+    ) -> List[Path]:
+        """
+        Enrich pending PR files with GraphQL batches of GRAPHQL_BATCH_SIZE PRs
+
+        Args:
+            pending: (file, repo, already loaded PR data) tuples
+            owner: Repository owner
+            stats: Statistics dictionary to update
+            progress: Progress display
+            task: Progress task to advance
 
+        Returns:
+            Successfully enriched files
+        """
+        # Group by repository, one query covers PRs of a single repository
+        by_repo: Dict[str, List[Tuple[Path, Dict]]] = {}
+        for pr_file, current_repo, pr_data in pending:
+            if not pr_data or not pr_data.get('number'):
+                console.print(f"[yellow]  ⚠️  No PR number in {pr_file.name}[/yellow]")
+                stats["failed"] += 1
                 progress.update(task, advance=1)
+                continue
+            by_repo.setdefault(current_repo, []).append((pr_file, pr_data))
+
+        chunks = [
+            (current_repo, entries[start:start + self.GRAPHQL_BATCH_SIZE])
+            for current_repo, entries in by_repo.items()
+            for start in range(0, len(entries), self.GRAPHQL_BATCH_SIZE)
+        ]
+
+        def enrich_chunk(current_repo: str, chunk: List[Tuple[Path, Dict]]) -> List[Path]:
+            """Fetch and write one chunk, return enriched files"""
+            try:
+                files_by_number = self.client.get_pr_files_batch(
+                    owner,
+                    current_repo,
+                    [pr_data['number'] for _, pr_data in chunk],
+                    batch_size=len(chunk)
+                )
+            except Exception as e:
+                console.print(f"[red]  ❌ Error fetching files for {current_repo}: {e}[/red]")
+                return []
+
+            enriched = []
+            for pr_file, pr_data in chunk:
+                files = files_by_number.get(pr_data['number'])
+                if files is None:
+                    console.print(f"[red]  ❌ Error enriching {pr_file.name}: PR not returned by GitHub[/red]")
+                    continue
 
-        return stats
+                try:
+                    self._set_files(pr_data, files)
+                    self._write_pr_data(pr_file, pr_data)
+                    enriched.append(pr_file)
+                except Exception as e:
+                    console.print(f"[red]  ❌ Error enriching {pr_file.name}: {e}[/red]")
+
+            return enriched
+
+        enriched_files = []
+
+        with ThreadPoolExecutor(max_workers=self._get_workers(len(chunks), "graphql")) as executor:
+            futures = {
+                executor.submit(enrich_chunk, current_repo, chunk): len(chunk)
+                for current_repo, chunk in chunks
+            }
+
+            for future in as_completed(futures):
+                enriched = future.result()
+                enriched_files.extend(enriched)
+                stats["enriched"] += len(enriched)
+                stats["failed"] += futures[future] - len(enriched)
+                progress.update(task, advance=futures[future])
+
+        return enriched_files
+
+    def _write_pr_data(self, pr_file_path: Path, pr_data: Dict):
+        """Save PR data back to its JSON file (serialized in memory, written with a single call)"""
+        data = json_utils.dumps_bytes(pr_data, indent=True)
+        with open(pr_file_path, 'wb') as f:
+            f.write(data)
 
     def enrich_organization(self, org_path: Path, owner: str) -> Dict:
         """
@@ -202,7 +541,8 @@ class PREnricher:
             return {}
 
         # Find all repository directories
-        repo_dirs = [d for d in org_path.iterdir() if d.is_dir()]
+        with os.scandir(org_path) as entries:
+            repo_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
 
         if not repo_dirs:
             console.print(f"[yellow]⚠️  No repository directories found in {org_path}[/yellow]")
@@ -210,24 +550,7 @@ class PREnricher:
 
         console.print(f"\n[cyan]📊 Found {len(repo_dirs)} repositories[/cyan]")
 
-        total_stats = {
-            "repositories": len(repo_dirs),
-            "total": 0,
-            "enriched": 0,
-            "skipped": 0,
-            "failed": 0
-        }
-
-        for repo_dir in repo_dirs:
-            repo_name = repo_dir.name
-            console.print(f"\n[bold cyan]Repository: {repo_name}[/bold cyan]")
-
-            stats = self.enrich_directory(repo_dir, owner, repo_name, recursive=False)
-
-            # Aggregate stats
-            total_stats["total"] += stats.get("total", 0)
-            total_stats["enriched"] += stats.get("enriched", 0)
-            total_stats["skipped"] += stats.get("skipped", 0)
-            total_stats["failed"] += stats.get("failed", 0)
+        # All repositories share one worker pool instead of being enriched one by one
+        stats = self._enrich_directories([(repo_dir, repo_dir.name) for repo_dir in repo_dirs], owner)
 
-        return total_stats
\ No newline at end of file
+        return {"repositories": len(repo_dirs), **stats}
\ No newline at end of file
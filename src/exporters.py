@@ -2,16 +2,73 @@
 Exporters for saving pull request data in various formats
 """
 
-import json
 import csv
+import shutil
+import operator
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict
+from contextlib import ExitStack, contextmanager
+from typing import List, Dict, Callable, Iterable, Iterator, Optional, TextIO, Tuple
 from datetime import datetime
 from rich.console import Console
 
+from . import json_utils
+
 
 console = Console()
 
+# Text exports are written through a large buffer to reduce write syscalls
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _pr_state(pr: Dict) -> str:
+    """Classify PR as open, merged or closed"""
+    if pr.get('state') == 'open':
+        return 'open'
+    return 'merged' if (pr.get('pull_request') or {}).get('merged_at') else 'closed'
+
+
+_label_name = operator.itemgetter('name')
+
+
+def _label_names(labels: Iterable[Dict], default: Optional[str] = '') -> List:
+    """Names of labels (default for labels without a name)"""
+    try:
+        return list(map(_label_name, labels))
+    except KeyError:
+        return [label.get('name', default) for label in labels]
+
+
+def _count_states(prs: Iterable[Dict]) -> Dict[str, int]:
+    """Count PRs by state in a single pass"""
+    counts = Counter(map(_pr_state, prs))
+    return {"open": counts['open'], "closed": counts['closed'], "merged": counts['merged']}
+
+
+class _PRStats:
+    """Statistics accumulated while PRs are written (PRs arrive newest first)"""
+
+    def __init__(self):
+        self.pr_numbers: List[int] = []
+        self.states = {"open": 0, "closed": 0, "merged": 0}
+        self.newest: Optional[str] = None
+        self.oldest: Optional[str] = None
+
+    def add(self, pr: Dict):
+        """Count single PR"""
+        self.pr_numbers.append(pr['number'])
+        self.states[_pr_state(pr)] += 1
+        if self.newest is None:
+            self.newest = pr['created_at']
+        self.oldest = pr['created_at']
+
+    def as_dict(self) -> Dict:
+        """Statistics in summary.json format (empty if no PRs were added)"""
+        if not self.pr_numbers:
+            return {}
+        return {"by_state": dict(self.states), "oldest": self.oldest, "newest": self.newest}
+
 
 class PRExporter:
     """Base class for exporting pull request data"""
@@ -19,280 +76,415 @@ class PRExporter:
     def __init__(self, output_dir: Path):
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Repository directories already created by this exporter
+        self._created_dirs: Dict[Tuple[str, str], Path] = {}
+        # Export time shared by all files of an export_multiple call
+        self._exported_at: Optional[datetime] = None
 
     def _create_repo_dir(self, org_name: str, repo_name: str) -> Path:
-        """Create directory for organization and repository"""
-        repo_dir = self.output_dir / org_name / repo_name
-        repo_dir.mkdir(parents=True, exist_ok=True)
+        """Create directory for organization and repository (once per exporter)"""
+        key = (org_name, repo_name)
+        repo_dir = self._created_dirs.get(key)
+        if repo_dir is None:
+            repo_dir = self.output_dir / org_name / repo_name
+            repo_dir.mkdir(parents=True, exist_ok=True)
+            self._created_dirs[key] = repo_dir
         return repo_dir
 
+    @contextmanager
+    def _shared_timestamp(self, exported_at: Optional[datetime] = None) -> Iterator[datetime]:
+        """Use one export time for all files written inside the block"""
+        self._exported_at = exported_at or datetime.now()
+        try:
+            yield self._exported_at
+        finally:
+            self._exported_at = None
+
+    def _export_time(self) -> datetime:
+        """Export time of the current batch, or now"""
+        return self._exported_at or datetime.now()
+
+    def _calculate_statistics(self, prs: List[Dict]) -> Dict:
+        """Calculate statistics from PRs"""
+        return {}
+
 
 class JSONExporter(PRExporter):
     """Export pull requests to JSON format"""
 
-    def export(self, prs: List[Dict], org_name: str, repo_name: str):
+    # Threads writing PR files (small writes overlap instead of running back to back)
+    WRITE_WORKERS = 8
+
+    def export(self, prs: Iterable[Dict], org_name: str, repo_name: str):
         """
         Export PRs to JSON files
 
         Creates:
         - Individual JSON file for each PR
         - summary.json with metadata
+
+        prs is consumed once, statistics are collected while writing.
         """
         repo_dir = self._create_repo_dir(org_name, repo_name)
 
-        console.print(f"\n[cyan]💾 Saving {len(prs)} PRs to {repo_dir}/[/cyan]")
+        console.print(f"\n[cyan]💾 Saving PRs to {repo_dir}/[/cyan]")
 
         # Save individual PR files
-        for pr in prs:
-            pr_number = pr['number']
-            filename = f"pr_{pr_number}.json"
-            filepath = repo_dir / filename
+        stats = _PRStats()
+        with self._pr_writer(repo_dir) as write_pr:
+            for pr in prs:
+                write_pr(pr)
+                stats.add(pr)
+
+        self._write_summary(repo_dir, stats.pr_numbers, org_name, repo_name, stats.as_dict())
 
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(pr, f, indent=2, ensure_ascii=False)
+        console.print(f"[green]✅ Saved {len(stats.pr_numbers)} PRs to {repo_dir}/[/green]")
+
+    @contextmanager
+    def _pr_writer(self, repo_dir: Path) -> Iterator[Callable[[Dict], None]]:
+        """
+        Yield function writing PRs to repo_dir from a thread pool
 
-        # Create summary
+        At most a few writes per worker are queued, so a stream of PRs is not
+        buffered as a whole. All files are written (and errors raised) when
+        the context exits.
+        """
+        with ThreadPoolExecutor(max_workers=self.WRITE_WORKERS) as executor:
+            pending = deque()
+
+            def write_pr(pr: Dict):
+                if len(pending) >= self.WRITE_WORKERS * 4:
+                    pending.popleft().result()
+                pending.append(executor.submit(self._write_pr, repo_dir, pr))
+
+            yield write_pr
+
+            while pending:
+                pending.popleft().result()
+
+    def _write_pr(self, repo_dir: Path, pr: Dict):
+        """Write single PR to pr_<number>.json"""
+        filepath = repo_dir / f"pr_{pr['number']}.json"
+
+        # Serialize in memory and write with a single call
+        data = json_utils.dumps_bytes(pr, indent=True)
+        with open(filepath, 'wb') as f:
+            f.write(data)
+
+    def _write_summary(
+        self,
+        repo_dir: Path,
+        pr_numbers: List[int],
+        org_name: str,
+        repo_name: str,
+        stats: Dict
+    ):
+        """Write summary.json with metadata"""
         summary = {
             "organization": org_name,
             "repository": repo_name,
-            "total_prs": len(prs),
-            "exported_at": datetime.now().isoformat(),
-            "pr_numbers": [pr['number'] for pr in prs],
-            "statistics": self._calculate_statistics(prs)
+            "total_prs": len(pr_numbers),
+            "exported_at": self._export_time().isoformat(),
+            "pr_numbers": pr_numbers,
+            "statistics": stats
         }
 
         summary_path = repo_dir / "summary.json"
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
-
-        console.print(f"[green]✅ Saved {len(prs)} PRs to {repo_dir}/[/green]")
+        data = json_utils.dumps_bytes(summary, indent=True)
+        with open(summary_path, 'wb') as f:
+            f.write(data)
 
     def export_multiple(self, repo_prs: Dict[str, List[Dict]], org_name: str):
         """Export PRs from multiple repositories"""
         total_prs = sum(len(prs) for prs in repo_prs.values())
         console.print(f"\n[cyan]💾 Saving {total_prs} PRs from {len(repo_prs)} repositories...[/cyan]")
 
-        for repo_name, prs in repo_prs.items():
-            if prs:
-                self.export(prs, org_name, repo_name)
+        with self._shared_timestamp():
+            for repo_name, prs in repo_prs.items():
+                if prs:
+                    self.export(prs, org_name, repo_name)
 
         console.print(f"[green]✅ Export complete! Saved to {self.output_dir}/{org_name}/[/green]")
 
-    def _calculate_statistics(self, prs: List[Dict]) -> Dict:
-        """Calculate statistics from PRs"""
-        if not prs:
-            return {}
-
-        states = {"open": 0, "closed": 0, "merged": 0}
-        for pr in prs:
-            if pr.get('state') == 'open':
-                states['open'] += 1
-            elif pr.get('pull_request', {}).get('merged_at'):
-                states['merged'] += 1
-            else:
-                states['closed'] += 1
-
-        return {
-            "by_state": states,
-            "oldest": prs[-1]['created_at'] if prs else None,
-            "newest": prs[0]['created_at'] if prs else None
-        }
-
 
 class CSVExporter(PRExporter):
     """Export pull requests to CSV format"""
 
-    def export(self, prs: List[Dict], org_name: str, repo_name: str):
+    # CSV columns
+    FIELDNAMES = [
+        'number',
+        'title',
+        'state',
+        'is_merged',
+        'author',
+        'created_at',
+        'updated_at',
+        'closed_at',
+        'merged_at',
+        'url',
+        'labels',
+        'comments',
+        'additions',
+        'deletions'
+    ]
+
+    def export(self, prs: Iterable[Dict], org_name: str, repo_name: str):
         """Export PRs to CSV file"""
+        self._export_one(prs, org_name, repo_name)
+
+    def _export_one(
+        self,
+        prs: Iterable[Dict],
+        org_name: str,
+        repo_name: str,
+        combined_writer: Optional[csv.DictWriter] = None
+    ):
+        """Write repository CSV, optionally adding each row to the combined CSV in the same pass"""
         repo_dir = self._create_repo_dir(org_name, repo_name)
         csv_path = repo_dir / "pull_requests.csv"
 
-        console.print(f"\n[cyan]💾 Saving {len(prs)} PRs to {csv_path}[/cyan]")
-
-        # Define CSV columns
-        fieldnames = [
-            'number',
-            'title',
-            'state',
-            'is_merged',
-            'author',
-            'created_at',
-            'updated_at',
-            'closed_at',
-            'merged_at',
-            'url',
-            'labels',
-            'comments',
-            'additions',
-            'deletions'
-        ]
+        console.print(f"\n[cyan]💾 Saving PRs to {csv_path}[/cyan]")
 
-        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
+        with open(csv_path, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            writer = csv.DictWriter(f, fieldnames=self.FIELDNAMES)
             writer.writeheader()
 
+            count = 0
             for pr in prs:
-                row = {
-                    'number': pr.get('number'),
-                    'title': pr.get('title'),
-                    'state': pr.get('state'),
-                    'is_merged': 'Yes' if pr.get('pull_request', {}).get('merged_at') else 'No',
-                    'author': pr.get('user', {}).get('login'),
-                    'created_at': pr.get('created_at'),
-                    'updated_at': pr.get('updated_at'),
-                    'closed_at': pr.get('closed_at', ''),
-                    'merged_at': pr.get('pull_request', {}).get('merged_at', ''),
-                    'url': pr.get('html_url'),
-                    'labels': ', '.join([label.get('name', '') for label in pr.get('labels', [])]),
-                    'comments': pr.get('comments', 0),
-                    'additions': pr.get('additions', 0),
-                    'deletions': pr.get('deletions', 0)
-                }
+                row = self._row(pr)
                 writer.writerow(row)
-
-        console.print(f"[green]✅ Saved CSV to {csv_path}[/green]")
+                if combined_writer:
+                    combined_writer.writerow(self._combined_row(repo_name, row))
+                count += 1
+
+        console.print(f"[green]✅ Saved {count} PRs to {csv_path}[/green]")
+
+    # Columns of all_pull_requests.csv
+    COMBINED_FIELDNAMES = [
+        'repository',
+        'number',
+        'title',
+        'state',
+        'is_merged',
+        'author',
+        'created_at',
+        'updated_at',
+        'closed_at',
+        'merged_at',
+        'url',
+        'labels',
+        'comments'
+    ]
+
+    def _row(self, pr: Dict) -> Dict:
+        """Build CSV row for single PR"""
+        return {
+            'number': pr.get('number'),
+            'title': pr.get('title'),
+            'state': pr.get('state'),
+            'is_merged': 'Yes' if pr.get('pull_request', {}).get('merged_at') else 'No',
+            'author': pr.get('user', {}).get('login'),
+            'created_at': pr.get('created_at'),
+            'updated_at': pr.get('updated_at'),
+            'closed_at': pr.get('closed_at', ''),
+            'merged_at': pr.get('pull_request', {}).get('merged_at', ''),
+            'url': pr.get('html_url'),
+            'labels': ', '.join(_label_names(pr.get('labels') or ())),
+            'comments': pr.get('comments', 0),
+            'additions': pr.get('additions', 0),
+            'deletions': pr.get('deletions', 0)
+        }
 
     def export_multiple(self, repo_prs: Dict[str, List[Dict]], org_name: str):
         """Export PRs from multiple repositories"""
         total_prs = sum(len(prs) for prs in repo_prs.values())
         console.print(f"\n[cyan]💾 Saving {total_prs} PRs to CSV files...[/cyan]")
 
-        for repo_name, prs in repo_prs.items():
-            if prs:
-                self.export(prs, org_name, repo_name)
+        # Per-repository files and the combined CSV are written in one pass
+        with self._open_combined(org_name) as (_, combined_writer):
+            for repo_name, prs in repo_prs.items():
+                if prs:
+                    self._export_one(prs, org_name, repo_name, combined_writer)
+
+        console.print(f"[green]✅ Export complete! Saved to {self.output_dir}/{org_name}/[/green]")
 
-        # Create combined CSV
+    @contextmanager
+    def _open_combined(self, org_name: str) -> Iterator[Tuple[TextIO, csv.DictWriter]]:
+        """Open all_pull_requests.csv (PRs from all repositories) and write its header"""
         combined_path = self.output_dir / org_name / "all_pull_requests.csv"
+        combined_path.parent.mkdir(parents=True, exist_ok=True)
         console.print(f"\n[cyan]💾 Creating combined CSV at {combined_path}[/cyan]")
 
-        fieldnames = [
-            'repository',
-            'number',
-            'title',
-            'state',
-            'is_merged',
-            'author',
-            'created_at',
-            'updated_at',
-            'closed_at',
-            'merged_at',
-            'url',
-            'labels',
-            'comments'
-        ]
-
-        with open(combined_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
+        with open(combined_path, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            writer = csv.DictWriter(f, fieldnames=self.COMBINED_FIELDNAMES)
             writer.writeheader()
+            yield f, writer
 
-            for repo_name, prs in repo_prs.items():
-                for pr in prs:
-                    row = {
-                        'repository': repo_name,
-                        'number': pr.get('number'),
-                        'title': pr.get('title'),
-                        'state': pr.get('state'),
-                        'is_merged': 'Yes' if pr.get('pull_request', {}).get('merged_at') else 'No',
-                        'author': pr.get('user', {}).get('login'),
-                        'created_at': pr.get('created_at'),
-                        'updated_at': pr.get('updated_at'),
-                        'closed_at': pr.get('closed_at', ''),
-                        'merged_at': pr.get('pull_request', {}).get('merged_at', ''),
-                        'url': pr.get('html_url'),
-                        'labels': ', '.join([label.get('name', '') for label in pr.get('labels', [])]),
-                        'comments': pr.get('comments', 0)
-                    }
-                    writer.writerow(row)
-
-        console.print(f"[green]✅ Export complete! Saved to {self.output_dir}/{org_name}/[/green]")
+    def _combined_row(self, repo_name: str, row: Dict) -> Dict:
+        """Build combined CSV row from repository CSV row"""
+        combined = {'repository': repo_name}
+        for field in self.COMBINED_FIELDNAMES[1:]:
+            combined[field] = row[field]
+        return combined
 
 
 class MarkdownExporter(PRExporter):
     """Export pull requests to Markdown format"""
 
-    def export(self, prs: List[Dict], org_name: str, repo_name: str):
-        """Export PRs to Markdown file"""
+    def export(self, prs: Iterable[Dict], org_name: str, repo_name: str):
+        """Export PRs to Markdown file (prs is consumed once)"""
+        self._export(prs, org_name, repo_name)
+
+    def _export(self, prs: Iterable[Dict], org_name: str, repo_name: str) -> Dict:
+        """
+        Export PRs to Markdown file
+
+        Returns:
+            Index statistics of the exported PRs ({} if there were none)
+        """
         repo_dir = self._create_repo_dir(org_name, repo_name)
         md_path = repo_dir / "pull_requests.md"
 
-        console.print(f"\n[cyan]💾 Saving {len(prs)} PRs to {md_path}[/cyan]")
+        console.print(f"\n[cyan]💾 Saving PRs to {md_path}[/cyan]")
 
-        with open(md_path, 'w', encoding='utf-8') as f:
-            # Header
-            f.write(f"# Pull Requests - {org_name}/{repo_name}\n\n")
-            f.write(f"**Total PRs:** {len(prs)}\n\n")
-            f.write(f"**Exported:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        # Sections are formatted while statistics are collected; the header
+        # is filled in once totals are known and the whole report is written
+        # with a single call
+        stats = _PRStats()
+        parts = [""]
+        for pr in prs:
+            parts.append(self._format_pr(pr))
+            stats.add(pr)
+        parts[0] = self._format_header(len(stats.pr_numbers), org_name, repo_name, stats.as_dict())
 
-            # Statistics
-            stats = self._calculate_statistics(prs)
-            if stats:
-                f.write("## Statistics\n\n")
-                f.write(f"- Open: {stats['by_state']['open']}\n")
-                f.write(f"- Merged: {stats['by_state']['merged']}\n")
-                f.write(f"- Closed: {stats['by_state']['closed']}\n\n")
+        with open(md_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write("".join(parts))
 
-            # PR list
-            f.write("## Pull Requests\n\n")
+        console.print(f"[green]✅ Saved Markdown to {md_path}[/green]")
 
-            for pr in prs:
-                # Determine status emoji
-                if pr.get('state') == 'open':
-                    status = "🟢 Open"
-                elif pr.get('pull_request', {}).get('merged_at'):
-                    status = "🟣 Merged"
-                else:
-                    status = "🔴 Closed"
-
-                f.write(f"### #{pr['number']} - {pr['title']}\n\n")
-                f.write(f"**Status:** {status}\n\n")
-                f.write(f"**Author:** @{pr.get('user', {}).get('login', 'unknown')}\n\n")
-                f.write(f"**Created:** {pr.get('created_at', 'N/A')}\n\n")
-
-                if pr.get('closed_at'):
-                    f.write(f"**Closed:** {pr['closed_at']}\n\n")
-
-                if pr.get('pull_request', {}).get('merged_at'):
-                    f.write(f"**Merged:** {pr['pull_request']['merged_at']}\n\n")
-
-                # Labels
-                labels = pr.get('labels', [])
-                if labels:
-                    label_names = [f"`{label.get('name')}`" for label in labels]
-                    f.write(f"**Labels:** {', '.join(label_names)}\n\n")
-
-                # URL
-                f.write(f"**URL:** [{pr['html_url']}]({pr['html_url']})\n\n")
-
-                # Body preview
-                body = pr.get('body', '')
-                if body:
-                    preview = body[:200] + "..." if len(body) > 200 else body
-                    f.write(f"**Description:**\n```\n{preview}\n```\n\n")
-
-                f.write("---\n\n")
+        # README index of export_multiple reuses the counted states
+        return {"by_state": dict(stats.states)} if stats.pr_numbers else {}
 
-        console.print(f"[green]✅ Saved Markdown to {md_path}[/green]")
+    def _write_header(self, f: TextIO, total: int, org_name: str, repo_name: str, stats: Dict):
+        """Write report header and statistics"""
+        f.write(self._format_header(total, org_name, repo_name, stats))
+
+    def _format_header(self, total: int, org_name: str, repo_name: str, stats: Dict) -> str:
+        """Format report header and statistics"""
+        # Header
+        parts = [
+            f"# Pull Requests - {org_name}/{repo_name}\n\n",
+            f"**Total PRs:** {total}\n\n",
+            f"**Exported:** {self._export_time().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        ]
+
+        # Statistics
+        if stats:
+            parts.append(
+                "## Statistics\n\n"
+                f"- Open: {stats['by_state']['open']}\n"
+                f"- Merged: {stats['by_state']['merged']}\n"
+                f"- Closed: {stats['by_state']['closed']}\n\n"
+            )
+
+        # PR list
+        parts.append("## Pull Requests\n\n")
+
+        return "".join(parts)
+
+    def _write_pr(self, f: TextIO, pr: Dict):
+        """Write section for single PR"""
+        f.write(self._format_pr(pr))
+
+    def _format_pr(self, pr: Dict) -> str:
+        """Format section for single PR"""
+        merged_at = (pr.get('pull_request') or {}).get('merged_at')
+
+        # Determine status emoji
+        if pr.get('state') == 'open':
+            status = "🟢 Open"
+        elif merged_at:
+            status = "🟣 Merged"
+        else:
+            status = "🔴 Closed"
+
+        parts = [
+            f"### #{pr['number']} - {pr['title']}\n\n",
+            f"**Status:** {status}\n\n",
+            f"**Author:** @{pr.get('user', {}).get('login', 'unknown')}\n\n",
+            f"**Created:** {pr.get('created_at', 'N/A')}\n\n"
+        ]
+
+        if pr.get('closed_at'):
+            parts.append(f"**Closed:** {pr['closed_at']}\n\n")
+
+        if merged_at:
+            parts.append(f"**Merged:** {merged_at}\n\n")
+
+        # Labels
+        labels = pr.get('labels')
+        if labels:
+            label_names = ', '.join(f"`{name}`" for name in _label_names(labels, None))
+            parts.append(f"**Labels:** {label_names}\n\n")
+
+        # URL
+        parts.append(f"**URL:** [{pr['html_url']}]({pr['html_url']})\n\n")
+
+        # Body preview
+        body = pr.get('body', '')
+        if body:
+            preview = body[:200] + "..." if len(body) > 200 else body
+            parts.append(f"**Description:**\n```\n{preview}\n```\n\n")
+
+        parts.append("---\n\n")
+
+        return "".join(parts)
 
     def export_multiple(self, repo_prs: Dict[str, List[Dict]], org_name: str):
         """Export PRs from multiple repositories"""
         total_prs = sum(len(prs) for prs in repo_prs.values())
         console.print(f"\n[cyan]💾 Saving {total_prs} PRs to Markdown files...[/cyan]")
 
-        for repo_name, prs in repo_prs.items():
-            if prs:
-                self.export(prs, org_name, repo_name)
+        with self._shared_timestamp():
+            repo_stats = {
+                repo_name: self._export(prs, org_name, repo_name)
+                for repo_name, prs in repo_prs.items()
+                if prs
+            }
+
+            self._write_index(repo_prs, org_name, repo_stats)
+
+        console.print(f"[green]✅ Export complete! Saved to {self.output_dir}/{org_name}/[/green]")
+
+    def _write_index(
+        self,
+        repo_prs: Dict[str, List[Dict]],
+        org_name: str,
+        repo_stats: Optional[Dict[str, Dict]] = None
+    ):
+        """
+        Write README.md index with per-repository statistics
+
+        Args:
+            repo_prs: Dictionary mapping repository name to list of PRs
+            org_name: Organization name
+            repo_stats: Statistics already counted while exporting, by repository
+                (computed from the PRs for repositories missing here)
+        """
+        repo_stats = repo_stats or {}
+        total_prs = sum(len(prs) for prs in repo_prs.values())
 
         # Create index file
         index_path = self.output_dir / org_name / "README.md"
-        with open(index_path, 'w', encoding='utf-8') as f:
+        with open(index_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
             f.write(f"# Pull Requests Report - {org_name}\n\n")
-            f.write(f"**Exported:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            f.write(f"**Exported:** {self._export_time().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
             f.write(f"**Total Repositories:** {len(repo_prs)}\n\n")
             f.write(f"**Total PRs:** {total_prs}\n\n")
 
             f.write("## Repositories\n\n")
             for repo_name, prs in repo_prs.items():
-                stats = self._calculate_statistics(prs)
+                stats = repo_stats[repo_name] if repo_name in repo_stats else self._calculate_statistics(prs)
                 f.write(f"### {repo_name}\n\n")
                 f.write(f"- Total PRs: {len(prs)}\n")
                 if stats:
@@ -301,20 +493,137 @@ class MarkdownExporter(PRExporter):
                     f.write(f"- Closed: {stats['by_state']['closed']}\n")
                 f.write(f"- [View Details]({repo_name}/pull_requests.md)\n\n")
 
-        console.print(f"[green]✅ Export complete! Saved to {self.output_dir}/{org_name}/[/green]")
-
     def _calculate_statistics(self, prs: List[Dict]) -> Dict:
         """Calculate statistics from PRs"""
         if not prs:
             return {}
 
-        states = {"open": 0, "closed": 0, "merged": 0}
-        for pr in prs:
-            if pr.get('state') == 'open':
-                states['open'] += 1
-            elif pr.get('pull_request', {}).get('merged_at'):
-                states['merged'] += 1
-            else:
-                states['closed'] += 1
-
-        return {"by_state": states}
\ No newline at end of file
+        states = _count_states(prs)
+
+        return {"by_state": states}
+
+
+class MultiExporter(PRExporter):
+    """Export pull requests to several formats in a single pass"""
+
+    FORMATS = ("json", "csv", "markdown")
+
+    def __init__(self, output_dir: Path, formats: Iterable[str]):
+        super().__init__(output_dir)
+        self.formats = [fmt for fmt in self.FORMATS if fmt in formats]
+        self.json_exporter = JSONExporter(output_dir)
+        self.csv_exporter = CSVExporter(output_dir)
+        self.markdown_exporter = MarkdownExporter(output_dir)
+
+    def export(self, prs: Iterable[Dict], org_name: str, repo_name: str) -> int:
+        """
+        Export PRs to all selected formats
+
+        Each PR is visited once and written to every open sink, so prs can be
+        a generator (e.g. GitHubClient.iter_pull_requests) and is never held
+        in memory as a whole. The Markdown body is written to a temporary
+        file and prefixed with the header once totals are known.
+
+        Returns:
+            Number of exported PRs
+        """
+        return len(self._export(prs, org_name, repo_name).pr_numbers)
+
+    def _export(
+        self,
+        prs: Iterable[Dict],
+        org_name: str,
+        repo_name: str,
+        combined_writer: Optional[csv.DictWriter] = None
+    ) -> _PRStats:
+        """Export PRs of one repository, optionally adding CSV rows to the combined CSV, return its statistics"""
+        repo_dir = self._create_repo_dir(org_name, repo_name)
+        md_path = repo_dir / "pull_requests.md"
+        md_part_path = repo_dir / "pull_requests.md.part"
+
+        console.print(f"\n[cyan]💾 Saving PRs ({', '.join(self.formats)}) to {repo_dir}/[/cyan]")
+
+        # Statistics are accumulated while writing
+        stats = _PRStats()
+
+        # The Markdown body is streamed to a .part file, removed also when
+        # writing fails partway
+        try:
+            with ExitStack() as stack:
+                write_json = None
+                csv_writer = None
+                md_file = None
+
+                if "json" in self.formats:
+                    write_json = stack.enter_context(self.json_exporter._pr_writer(repo_dir))
+
+                if "csv" in self.formats:
+                    csv_file = stack.enter_context(
+                        open(repo_dir / "pull_requests.csv", 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE)
+                    )
+                    csv_writer = csv.DictWriter(csv_file, fieldnames=CSVExporter.FIELDNAMES)
+                    csv_writer.writeheader()
+
+                if "markdown" in self.formats:
+                    md_file = stack.enter_context(
+                        open(md_part_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE)
+                    )
+
+                for pr in prs:
+                    stats.add(pr)
+
+                    if write_json:
+                        write_json(pr)
+                    if csv_writer:
+                        row = self.csv_exporter._row(pr)
+                        csv_writer.writerow(row)
+                        if combined_writer:
+                            combined_writer.writerow(self.csv_exporter._combined_row(repo_name, row))
+                    if md_file:
+                        self.markdown_exporter._write_pr(md_file, pr)
+
+            total = len(stats.pr_numbers)
+
+            if "json" in self.formats:
+                self.json_exporter._write_summary(repo_dir, stats.pr_numbers, org_name, repo_name, stats.as_dict())
+
+            if "markdown" in self.formats:
+                with open(md_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+                    self.markdown_exporter._write_header(f, total, org_name, repo_name, stats.as_dict())
+                    with open(md_part_path, 'r', encoding='utf-8') as part:
+                        shutil.copyfileobj(part, f)
+        finally:
+            if "markdown" in self.formats:
+                md_part_path.unlink(missing_ok=True)
+
+        console.print(f"[green]✅ Saved {total} PRs to {repo_dir}/[/green]")
+
+        return stats
+
+    def export_multiple(self, repo_prs: Dict[str, List[Dict]], org_name: str):
+        """Export PRs from multiple repositories"""
+        total_prs = sum(len(prs) for prs in repo_prs.values())
+        console.print(f"\n[cyan]💾 Saving {total_prs} PRs from {len(repo_prs)} repositories...[/cyan]")
+
+        with ExitStack() as stack:
+            # Summaries, reports and the index share one export time
+            exported_at = stack.enter_context(self._shared_timestamp())
+            for exporter in (self.json_exporter, self.markdown_exporter):
+                stack.enter_context(exporter._shared_timestamp(exported_at))
+
+            combined_writer = None
+            if "csv" in self.formats:
+                _, combined_writer = stack.enter_context(self.csv_exporter._open_combined(org_name))
+
+            # Index of the Markdown reports reuses the counted states instead of another pass
+            repo_stats = {}
+            for repo_name, prs in repo_prs.items():
+                if prs:
+                    stats = self._export(prs, org_name, repo_name, combined_writer)
+                    if stats.pr_numbers:
+                        repo_stats[repo_name] = {"by_state": dict(stats.states)}
+
+            if "markdown" in self.formats:
+                self.markdown_exporter._write_index(repo_prs, org_name, repo_stats)
+
+        console.print(f"[green]✅ Export complete! Saved to {self.output_dir}/{org_name}/[/green]")
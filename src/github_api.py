@@ -3,15 +3,41 @@ GitHub API client for fetching pull requests and repository data
 """
 
 import time
+import random
+import heapq
+import threading
+import operator
+import hashlib
+import itertools
 import requests
-from typing import List, Dict, Optional, Tuple, Union
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property
+from pathlib import Path
+from typing import Iterator, List, Dict, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlparse
+from email.utils import parsedate_to_datetime
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from . import json_utils
 
 console = Console()
 
+# Sort key of PRs (search results are ordered by it)
+_created_at = operator.itemgetter('created_at')
+
+# GraphQL PatchStatus -> REST file status
+_GRAPHQL_CHANGE_TYPES = {
+    "ADDED": "added",
+    "DELETED": "removed",
+    "MODIFIED": "modified",
+    "RENAMED": "renamed",
+    "COPIED": "copied",
+    "CHANGED": "changed",
+}
+
 
 class GitHubAPIError(Exception):
     """Custom exception for GitHub API errors"""
@@ -23,43 +49,252 @@ class RateLimitError(GitHubAPIError):
     pass
 
 
+class TokenBucket:
+    """
+    Client-side rate limiter for one GitHub rate limit resource
+
+    Holds up to capacity tokens refilled at capacity / window tokens per
+    second. Requests take a token and wait when none is left, so a run
+    bursts up to the limit and then continues at the steady rate instead of
+    running into 403 responses. Remaining/reset headers of responses keep
+    the bucket in sync with GitHub.
+    """
+
+    def __init__(self, capacity: int, window: float):
+        self.capacity = capacity
+        self.window = window
+        self.rate = capacity / window
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self.reset: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    def acquire(self, cost: int = 1):
+        """Take cost tokens, sleeping until they are available"""
+        with self._lock:
+            self._refill(time.monotonic())
+            # Tokens are reserved even if not yet available, so concurrent
+            # callers queue up behind each other instead of all waking at once
+            self.tokens -= cost
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def hold(self, seconds: float):
+        """Hand out no tokens for the next seconds (e.g. Retry-After)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens = min(self.tokens, -seconds * self.rate)
+
+    def update(self, limit: int, remaining: int, reset: int, reset_in: float = 0.0):
+        """
+        Sync with GitHub's rate limit headers
+
+        Args:
+            limit: Requests per window
+            remaining: Requests left in the window
+            reset: Window reset timestamp (identifies the window)
+            reset_in: Seconds until the reset, by the server clock
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            if limit and limit != self.capacity:
+                self.capacity = limit
+                self.rate = limit / self.window
+
+            if remaining == 0:
+                # Nothing left until the window resets
+                self.tokens = min(self.tokens, -reset_in * self.rate)
+            elif reset != self.reset:
+                # New window, GitHub's count is authoritative
+                self.tokens = float(remaining)
+            else:
+                self.tokens = min(self.tokens, float(remaining))
+            self.reset = reset
+
+
 class GitHubClient:
     """Client for interacting with GitHub API"""
 
-    def __init__(self, token: str):
+    # Maximum number of pooled HTTPS connections (multi-repo fetch runs
+    # several repositories at once, each fetching pages concurrently)
+    POOL_SIZE = 32
+
+    # Threads fetching the remaining pages of a paginated listing
+    PAGE_WORKERS = 4
+
+    # Seconds each request may spend sleeping in retry backoff (the first
+    # three backoffs always fit), and cap of one (jittered) backoff
+    RETRY_BUDGET = 60
+    MAX_BACKOFF = 30
+
+    # Fields of organizations and repositories used by the CLI (listings
+    # are projected to them, full objects have around a hundred keys)
+    ORG_FIELDS = ("login", "id", "description")
+    REPO_FIELDS = ("name", "full_name", "description", "private", "default_branch", "updated_at")
+
+    # Default limits per resource as (requests, window in seconds) until
+    # GitHub reports the actual ones
+    RATE_LIMITS = {
+        "core": (5000, 3600.0),
+        "search": (30, 60.0),
+        "graphql": (5000, 3600.0),
+    }
+
+    def __init__(self, token: str, etag_cache_dir: Optional[Path] = None):
         self.token = token
         self.headers = {
             "Authorization": f"token {token}",
             "Accept": "application/vnd.github.v3+json"
         }
         self.base_url = "https://api.github.com"
+
+        # Shared session keeps TLS connections alive between requests; the pool
+        # is sized for the thread pools used by multi-repo fetch and enrichment.
+        # Retries are handled by _make_request, not by urllib3
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.POOL_SIZE, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(self.headers)
         self.username: Optional[str] = None
         self._rate_limit_remaining: Optional[int] = None
         self._rate_limit_reset: Optional[int] = None
+        # resource -> (monotonic timestamp, (remaining, reset))
+        self._rl_cache: Dict[str, Tuple[float, Tuple[int, int]]] = {}
+        # Responses revalidated with If-None-Match (disabled if None)
+        self.etag_cache_dir = Path(etag_cache_dir) if etag_cache_dir else None
+        # Client-side rate limiting per resource
+        self.buckets = {
+            resource: TokenBucket(capacity, window)
+            for resource, (capacity, window) in self.RATE_LIMITS.items()
+        }
+
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
+
+    def __enter__(self) -> "GitHubClient":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _bucket_for(self, url: str) -> Optional[TokenBucket]:
+        """Rate limit bucket charged by request to url (None for free endpoints)"""
+        if url.startswith(f"{self.base_url}/search/"):
+            return self.buckets["search"]
+        if url == f"{self.base_url}/graphql":
+            return self.buckets["graphql"]
+        if url == f"{self.base_url}/rate_limit":
+            return None
+        return self.buckets["core"]
+
+    @staticmethod
+    def _seconds_until(timestamp: int, response: requests.Response) -> float:
+        """Seconds until timestamp, measured against the server's Date header if present"""
+        now = time.time()
+        date = response.headers.get('Date')
+        if date:
+            try:
+                now = parsedate_to_datetime(date).timestamp()
+            except (TypeError, ValueError):
+                pass
+        return max(0.0, timestamp - now)
 
     def _handle_rate_limit(self, response: requests.Response):
-        """Handle rate limiting from GitHub API"""
-        self._rate_limit_remaining = int(response.headers.get('X-RateLimit-Remaining', 0))
-        self._rate_limit_reset = int(response.headers.get('X-RateLimit-Reset', 0))
-
-        if response.status_code == 403 and self._rate_limit_remaining == 0:
-            reset_time = datetime.fromtimestamp(self._rate_limit_reset)
-            wait_seconds = (reset_time - datetime.now()).total_seconds()
-
-            if wait_seconds > 0:
-                console.print(f"\n[yellow]⚠️  Rate limit exceeded. Waiting {int(wait_seconds)} seconds...[/yellow]")
-                time.sleep(wait_seconds + 1)
-                return True
-        return False
-
-    def _make_request(self, url: str, params: Optional[Dict] = None) -> requests.Response:
-        """Make HTTP request with error handling and rate limiting"""
-        max_retries = 3
+        """
+        Handle rate limiting from GitHub API
+
+        Syncs the token bucket of the response's resource. On a rate limited
+        response (403/429 with Retry-After or no requests remaining) the
+        bucket is held for the wait, so the retry in _make_request sleeps in
+        TokenBucket.acquire, on the same clock as proactive throttling.
+
+        Returns:
+            True if the request should be retried after waiting
+        """
+        headers = response.headers
+        has_limits = 'X-RateLimit-Remaining' in headers
+        self._rate_limit_remaining = int(headers.get('X-RateLimit-Remaining', 0))
+        self._rate_limit_reset = int(headers.get('X-RateLimit-Reset', 0))
+        exhausted = has_limits and self._rate_limit_remaining == 0
+        reset_in = self._seconds_until(self._rate_limit_reset, response) if exhausted else 0.0
+
+        bucket = self.buckets.get(headers.get('X-RateLimit-Resource', ''))
+        if bucket and has_limits:
+            bucket.update(
+                int(headers.get('X-RateLimit-Limit', 0)),
+                self._rate_limit_remaining,
+                self._rate_limit_reset,
+                reset_in
+            )
+
+        if response.status_code not in (403, 429):
+            return False
+
+        retry_after = headers.get('Retry-After')
+        if retry_after is not None:
+            try:
+                wait_seconds = float(retry_after)
+            except ValueError:
+                wait_seconds = 60.0
+        elif exhausted:
+            wait_seconds = reset_in + 1
+        else:
+            return False
+
+        if wait_seconds > 0:
+            console.print(f"\n[yellow]⚠️  Rate limit exceeded. Waiting {int(wait_seconds)} seconds...[/yellow]")
+            if bucket:
+                bucket.hold(wait_seconds)
+            else:
+                time.sleep(wait_seconds)
+        return True
+
+    def _make_request(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        json_body: Optional[Dict] = None,
+        headers: Optional[Dict] = None
+    ) -> requests.Response:
+        """
+        Make HTTP request with error handling and rate limiting (POST if json_body is given)
+
+        Server errors (5xx), 429 and connection errors are retried with full
+        jitter backoff, so concurrent workers don't retry in lockstep, until
+        the backoff sleeps of this request would exceed RETRY_BUDGET. Time
+        spent in requests, rate limit waits and throttling doesn't count.
+
+        Args:
+            url: API URL
+            params: Query parameters
+            json_body: JSON body to POST
+            headers: Extra request headers
+
+        Returns:
+            Successful response
+        """
+        slept = 0.0
         retry_count = 0
+        bucket = self._bucket_for(url)
+
+        while True:
+            if bucket:
+                bucket.acquire()
 
-        while retry_count < max_retries:
             try:
-                response = requests.get(url, headers=self.headers, params=params, timeout=30)
+                if json_body is not None:
+                    response = self.session.post(url, json=json_body, timeout=30)
+                else:
+                    response = self.session.get(url, params=params, headers=headers, timeout=30)
 
                 # Handle rate limiting
                 if self._handle_rate_limit(response):
@@ -69,39 +304,188 @@ class GitHubClient:
                 return response
 
             except requests.exceptions.HTTPError as e:
-                if e.response.status_code == 401:
+                status = e.response.status_code
+                if status == 401:
                     raise GitHubAPIError("Invalid GitHub token. Please check your credentials.")
-                elif e.response.status_code == 403:
+                elif status == 403:
                     raise GitHubAPIError("Access forbidden. Make sure your token has 'repo' scope.")
-                elif e.response.status_code == 404:
+                elif status == 404:
                     raise GitHubAPIError("Resource not found. Check organization/repository name.")
-                else:
-                    retry_count += 1
-                    if retry_count >= max_retries:
-                        raise GitHubAPIError(f"HTTP Error: {e}")
-                    console.print(f"[yellow]Retrying... ({retry_count}/{max_retries})[/yellow]")
-                    time.sleep(2 ** retry_count)  # Exponential backoff
+                elif status == 422:
+                    raise GitHubAPIError(f"Validation failed: {e}")
+                elif status < 500 and status != 429:
+                    raise GitHubAPIError(f"HTTP Error: {e}")
+                error = f"HTTP Error: {e}"
 
             except requests.exceptions.RequestException as e:
-                retry_count += 1
-                if retry_count >= max_retries:
-                    raise GitHubAPIError(f"Request failed: {e}")
-                console.print(f"[yellow]Retrying... ({retry_count}/{max_retries})[/yellow]")
-                time.sleep(2 ** retry_count)
+                error = f"Request failed: {e}"
+
+            # Full jitter exponential backoff, unless it would exceed the budget
+            retry_count += 1
+            delay = random.uniform(0, min(2 ** retry_count, self.MAX_BACKOFF))
+            if slept + delay > self.RETRY_BUDGET:
+                raise GitHubAPIError(error)
+            console.print(f"[yellow]Retrying... ({retry_count})[/yellow]")
+            time.sleep(delay)
+            slept += delay
+
+    @staticmethod
+    def _json(response: requests.Response) -> Union[List, Dict]:
+        """Decode JSON body straight from the response bytes (orjson if installed)"""
+        return json_utils.loads(response.content)
+
+    @staticmethod
+    def _last_page(response: requests.Response) -> Optional[int]:
+        """Page number of the Link rel="last" header, None if there is none"""
+        last_url = response.links.get("last", {}).get("url")
+        if not last_url:
+            return None
+        try:
+            return int(parse_qs(urlparse(last_url).query)["page"][0])
+        except (KeyError, ValueError):
+            return None
+
+    def _get_page(self, url: str, params: Dict) -> Tuple[Union[List, Dict], Optional[int]]:
+        """GET one JSON page, return (body, last page number if known)"""
+        response = self._make_request(url, params=params)
+        return self._json(response), self._last_page(response)
+
+    def _get_json_conditional(self, url: str, params: Optional[Dict] = None) -> Tuple[Union[List, Dict], Optional[int]]:
+        """
+        GET JSON, revalidating a cached copy with its ETag
 
-        raise GitHubAPIError("Max retries exceeded")
+        GitHub answers an unchanged resource with 304 Not Modified and no
+        body, which is not counted against the rate limit.
 
-    def get_current_user(self) -> Dict:
-        """Get authenticated user information"""
+        Args:
+            url: Request URL
+            params: Query parameters
+
+        Returns:
+            (decoded response body, last page number if known), cached copy on 304
+        """
+        if self.etag_cache_dir is None:
+            return self._get_page(url, params or {})
+
+        key = f"{url}?{sorted((params or {}).items())}"
+        cache_path = self.etag_cache_dir / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+
+        cached = None
+        try:
+            cached = json_utils.loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            pass  # Missing or corrupted entry
+
+        response = self._make_request(
+            url,
+            params=params,
+            headers={"If-None-Match": cached["etag"]} if cached else None
+        )
+
+        if response.status_code == 304 and cached:
+            return cached["body"], cached.get("last_page")
+
+        body = self._json(response)
+        last_page = self._last_page(response)
+        etag = response.headers.get("ETag")
+        if etag:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                cache_path.write_bytes(json_utils.dumps_bytes({"etag": etag, "body": body, "last_page": last_page}))
+            except OSError as e:
+                console.print(f"[dim]Could not write cache: {e}[/dim]")
+
+        return body, last_page
+
+    def _paginate(
+        self,
+        url: str,
+        params: Dict,
+        items_key: Optional[str] = None,
+        max_pages: Optional[int] = None,
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Iterator[List]:
+        """
+        Yield items of a paginated listing page by page, in page order
+
+        The first page is fetched alone; its Link rel="last" header gives the
+        page count, and the remaining pages are then fetched concurrently,
+        at most PAGE_WORKERS pages ahead of the consumer.
+        Without the header, pages are fetched one by one until a short page.
+        Pages are revalidated with their ETags when an ETag cache is set.
+
+        Args:
+            url: Listing URL
+            params: Query parameters (must contain per_page)
+            items_key: Key of the item list in the response (search endpoints), None if the body is the list
+            max_pages: Upper limit of fetched pages
+            fields: Keep only these keys of each item (all keys if None)
+
+        Yields:
+            Items of each non-empty page
+        """
+        per_page = params["per_page"]
+
+        def fetch_items(page: int) -> Tuple[List, Optional[int]]:
+            body, last_page = self._get_json_conditional(url, {**params, "page": page})
+            items = (body.get(items_key) if items_key else body) or []
+            if fields:
+                items = [{key: item.get(key) for key in fields} for item in items]
+            return items, last_page
+
+        items, last_page = fetch_items(1)
+        if not items:
+            return
+        yield items
+
+        if last_page is not None:
+            pages = range(2, last_page + 1 if max_pages is None else min(last_page, max_pages) + 1)
+            if not pages:
+                return
+
+            # Sliding window of in-flight pages, so a large listing is not
+            # buffered in full while the consumer processes earlier pages
+            pending_pages = iter(pages)
+            with ThreadPoolExecutor(max_workers=min(self.PAGE_WORKERS, len(pages))) as executor:
+                window = deque(
+                    executor.submit(fetch_items, page)
+                    for page in itertools.islice(pending_pages, self.PAGE_WORKERS)
+                )
+                while window:
+                    items = window.popleft().result()[0]
+                    if not items:
+                        for future in window:
+                            future.cancel()
+                        return
+                    for page in itertools.islice(pending_pages, 1):
+                        window.append(executor.submit(fetch_items, page))
+                    yield items
+            return
+
+        # No Link header, continue serially while pages are full
+        page = 1
+        while len(items) >= per_page and (max_pages is None or page < max_pages):
+            page += 1
+            items = fetch_items(page)[0]
+            if not items:
+                return
+            yield items
+
+    @cached_property
+    def current_user(self) -> Dict:
+        """Authenticated user information (requested once per client)"""
         response = self._make_request(f"{self.base_url}/user")
-        user_data = response.json()
+        user_data = self._json(response)
         self.username = user_data['login']
         return user_data
 
+    def get_current_user(self) -> Dict:
+        """Get authenticated user information"""
+        return self.current_user
+
     def get_organizations(self) -> List[Dict]:
-        """Get all organizations for authenticated user"""
+        """Get all organizations for authenticated user (ORG_FIELDS of each)"""
         orgs = []
-        page = 1
         per_page = 100
 
         with Progress(
@@ -111,28 +495,21 @@ class GitHubClient:
         ) as progress:
             task = progress.add_task("[cyan]Fetching organizations...", total=None)
 
-            while True:
-                response = self._make_request(
-                    f"{self.base_url}/user/orgs",
-                    params={"per_page": per_page, "page": page}
-                )
-                page_orgs = response.json()
-
-                if not page_orgs:
-                    break
-
+            for page_orgs in self._paginate(
+                f"{self.base_url}/user/orgs",
+                {"per_page": per_page},
+                fields=self.ORG_FIELDS
+            ):
                 orgs.extend(page_orgs)
                 progress.update(task, description=f"[cyan]Fetching organizations... ({len(orgs)} found)")
-                page += 1
 
             progress.update(task, completed=True)
 
         return orgs
 
     def get_repositories(self, org_name: str) -> List[Dict]:
-        """Get all repositories from organization"""
+        """Get all repositories from organization (REPO_FIELDS of each)"""
         repos = []
-        page = 1
         per_page = 100
 
         with Progress(
@@ -142,24 +519,22 @@ class GitHubClient:
         ) as progress:
             task = progress.add_task(f"[cyan]Fetching repositories from {org_name}...", total=None)
 
-            while True:
-                response = self._make_request(
-                    f"{self.base_url}/orgs/{org_name}/repos",
-                    params={"per_page": per_page, "page": page, "type": "all"}
-                )
-                page_repos = response.json()
-
-                if not page_repos:
-                    break
-
+            for page_repos in self._paginate(
+                f"{self.base_url}/orgs/{org_name}/repos",
+                {"per_page": per_page, "type": "all"},
+                fields=self.REPO_FIELDS
+            ):
                 repos.extend(page_repos)
                 progress.update(task, description=f"[cyan]Fetching repositories... ({len(repos)} found)")
-                page += 1
 
             progress.update(task, completed=True)
 
         return repos
 
+    def get_repository(self, owner: str, repo: str) -> Dict:
+        """Get single repository by name"""
+        return self._get_json_conditional(f"{self.base_url}/repos/{owner}/{repo}")[0]
+
     def get_pull_requests(
         self,
         owner: str,
@@ -188,10 +563,7 @@ class GitHubClient:
             List of pull request dictionaries
         """
         # Convert string to list for uniform processing
-        if isinstance(state, str):
-            states = [state]
-        else:
-            states = state
+        states = self._collapse_states([state] if isinstance(state, str) else state, merged_only)
 
         # If "all" is in states, just fetch everything
         if "all" in states:
@@ -199,9 +571,9 @@ class GitHubClient:
                 owner, repo, author, "all", labels, since, until, merged_only
             )
 
-        # Fetch PRs for each state and combine
-        all_prs = []
-        seen_numbers = set()
+        # Fetch PRs for each state; PRs found by several searches are counted once
+        per_state = []
+        unique: Dict[int, Dict] = {}
 
         with Progress(
             SpinnerColumn(),
@@ -218,24 +590,91 @@ class GitHubClient:
                     owner, repo, author, s, labels, since, until, merged_only
                 )
 
-                # Add only unique PRs (deduplicate by number)
+                per_state.append(prs)
                 for pr in prs:
-                    pr_number = pr['number']
-                    if pr_number not in seen_numbers:
-                        all_prs.append(pr)
-                        seen_numbers.add(pr_number)
+                    unique.setdefault(pr['number'], pr)
 
                 progress.update(
                     task,
                     advance=1,
-                    description=f"[cyan]Fetching PRs... ({len(all_prs)} unique found)"
+                    description=f"[cyan]Fetching PRs... ({len(unique)} unique found)"
                 )
 
-        # Sort by created date (newest first)
-        all_prs.sort(key=lambda x: x.get('created_at', ''), reverse=True)
+        # Every state list is already sorted by created date (newest first),
+        # so they are merged instead of sorted; duplicates keep their first copy
+        all_prs = []
+        seen_numbers = set()
+        for pr in heapq.merge(*per_state, key=_created_at, reverse=True):
+            if pr['number'] not in seen_numbers:
+                seen_numbers.add(pr['number'])
+                all_prs.append(pr)
 
         return all_prs
 
+    def iter_pull_requests(
+        self,
+        owner: str,
+        repo: str,
+        author: str,
+        state: Union[str, List[str]] = "all",
+        labels: Optional[List[str]] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        merged_only: bool = False
+    ) -> Iterator[Dict]:
+        """
+        Iterate pull requests by author, yielding them as search pages arrive
+
+        Takes the same arguments as get_pull_requests and yields the same PRs
+        in the same order (newest first), but only a few pages per state are
+        held in memory at a time (the one being consumed and up to
+        PAGE_WORKERS fetched ahead).
+
+        Yields:
+            Pull request dictionaries
+        """
+        states = self._collapse_states([state] if isinstance(state, str) else state, merged_only)
+
+        if "all" in states:
+            yield from self._iter_prs_by_state(
+                owner, repo, author, "all", labels, since, until, merged_only
+            )
+            return
+
+        # Every state stream is already sorted by created date, so they can be
+        # merged lazily instead of collected and sorted
+        streams = [
+            self._iter_prs_by_state(owner, repo, author, s, labels, since, until, merged_only)
+            for s in states
+        ]
+        seen_numbers = set()
+
+        for pr in heapq.merge(*streams, key=_created_at, reverse=True):
+            if pr['number'] not in seen_numbers:
+                seen_numbers.add(pr['number'])
+                yield pr
+
+    @staticmethod
+    def _collapse_states(states: List[str], merged_only: bool = False) -> List[str]:
+        """
+        Reduce requested states to the fewest searches returning the same PRs
+
+        Merged PRs are closed, so "closed" covers "merged" and "open" plus
+        "closed" is everything. Other combinations (e.g. open and merged)
+        still need one search per state.
+        """
+        if merged_only:
+            # With merged_only a closed search only returns merged PRs
+            states = ["merged" if s == "closed" else s for s in states]
+
+        states = list(dict.fromkeys(states))
+
+        if "all" in states or {"open", "closed"} <= set(states):
+            return ["all"]
+        if "closed" in states and "merged" in states:
+            states.remove("merged")
+        return states
+
     def _fetch_prs_by_state(
         self,
         owner: str,
@@ -253,10 +692,65 @@ class GitHubClient:
         Returns:
             List of pull request dictionaries
         """
-        prs = []
-        page = 1
+        return list(self._iter_prs_by_state(
+            owner, repo, author, state, labels, since, until, merged_only
+        ))
+
+    @staticmethod
+    def _use_issues_listing(
+        state: str,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        merged_only: bool = False
+    ) -> bool:
+        """
+        Check if a query can be served by the issues listing instead of search
+
+        The listing filters by creator, state and labels only (its 'since' is
+        the update time), so created date ranges and merged filters need search.
+        """
+        if since or until:
+            return False
+        if state == "closed":
+            return not merged_only
+        return state in ("open", "all")
+
+    def _iter_prs_by_state(
+        self,
+        owner: str,
+        repo: str,
+        author: str,
+        state: str,
+        labels: Optional[List[str]] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        merged_only: bool = False
+    ) -> Iterator[Dict]:
+        """
+        Internal generator yielding PRs by single state, page by page
+
+        Results are ordered by created date (newest first). Queries without
+        date or merged filters use the repository issues listing (core rate
+        limit, no 1000 results cap); the others need the search API.
+        """
         per_page = 100
 
+        if self._use_issues_listing(state, since, until, merged_only):
+            params = {
+                "creator": author,
+                "state": state,
+                "sort": "created",
+                "direction": "desc",
+                "per_page": per_page
+            }
+            if labels:
+                params["labels"] = ",".join(labels)
+
+            # The listing returns issues as well, PRs carry a pull_request key
+            for items in self._paginate(f"{self.base_url}/repos/{owner}/{repo}/issues", params):
+                yield from (item for item in items if 'pull_request' in item)
+            return
+
         # Build search query
         query_parts = [
             f"repo:{owner}/{repo}",
@@ -283,31 +777,17 @@ class GitHubClient:
 
         query = " ".join(query_parts)
 
-        while True:
-            response = self._make_request(
-                f"{self.base_url}/search/issues",
-                params={
-                    "q": query,
-                    "per_page": per_page,
-                    "page": page,
-                    "sort": "created",
-                    "order": "desc"
-                }
-            )
-            data = response.json()
-
-            if not data.get('items'):
-                break
-
-            prs.extend(data['items'])
-
-            # Check if we have more pages
-            if len(data['items']) < per_page:
-                break
-
-            page += 1
-
-        return prs
+        for items in self._paginate(
+            f"{self.base_url}/search/issues",
+            {
+                "q": query,
+                "per_page": per_page,
+                "sort": "created",
+                "order": "desc"
+            },
+            items_key="items"
+        ):
+            yield from items
 
     def get_pull_requests_from_multiple_repos(
         self,
@@ -318,18 +798,32 @@ class GitHubClient:
         labels: Optional[List[str]] = None,
         since: Optional[str] = None,
         until: Optional[str] = None,
-        merged_only: bool = False
-    ) -> Dict[str, List[Dict]]:
+        merged_only: bool = False,
+        max_workers: int = 8
+    ) -> Tuple[Dict[str, List[Dict]], int]:
         """
         Get pull requests from multiple repositories
 
+        Repositories are fetched concurrently in a bounded thread pool, and
+        the rate limit token buckets pace the requests when the limit is
+        low. A repository that fails is reported and gets an empty list.
+
         Args:
             state: PR state (all, open, closed, merged) or list of states ["open", "merged"]
+            max_workers: Maximum number of repositories fetched at once
 
         Returns:
-            Dictionary mapping repository name to list of PRs
+            Tuple of (dictionary mapping repository name to list of PRs, total number of PRs)
         """
         results = {}
+        total = 0
+        workers = max(1, min(max_workers, len(repo_names)))
+
+        # Sync the rate limit buckets (one response covers all) before fanning out
+        try:
+            self.get_rate_limit_status("search")
+        except GitHubAPIError:
+            pass
 
         with Progress(
             SpinnerColumn(),
@@ -338,42 +832,65 @@ class GitHubClient:
         ) as progress:
             task = progress.add_task("[cyan]Fetching PRs from repositories...", total=len(repo_names))
 
-            for repo_name in repo_names:
-                try:
-                    prs = self.get_pull_requests(
-                        org_name,
-                        repo_name,
-                        author,
-                        state,
-                        labels,
-                        since,
-                        until,
-                        merged_only
-                    )
-                    results[repo_name] = prs
-                    progress.update(
-                        task,
-                        advance=1,
-                        description=f"[cyan]Processed {repo_name} ({len(prs)} PRs)"
-                    )
-                except GitHubAPIError as e:
-                    console.print(f"[yellow]⚠️  Error fetching from {repo_name}: {e}[/yellow]")
-                    results[repo_name] = []
-                    progress.update(task, advance=1)
-
-        return results
-
-    def get_rate_limit_status(self) -> Tuple[int, int]:
+            # iter_pull_requests has no progress display of its own, so it can
+            # run in worker threads under the single progress bar above
+            def fetch(repo_name: str) -> List[Dict]:
+                return list(self.iter_pull_requests(
+                    org_name, repo_name, author, state, labels, since, until, merged_only
+                ))
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(fetch, repo_name): repo_name for repo_name in repo_names}
+
+                for future in as_completed(futures):
+                    repo_name = futures[future]
+                    try:
+                        prs = future.result()
+                        results[repo_name] = prs
+                        total += len(prs)
+                        progress.update(
+                            task,
+                            advance=1,
+                            description=f"[cyan]Processed {repo_name} ({len(prs)} PRs)"
+                        )
+                    except GitHubAPIError as e:
+                        console.print(f"[yellow]⚠️  Error fetching from {repo_name}: {e}[/yellow]")
+                        results[repo_name] = []
+                        progress.update(task, advance=1)
+
+        # Keep repositories in the requested order
+        return {repo_name: results[repo_name] for repo_name in repo_names}, total
+
+    def get_rate_limit_status(self, resource: str = "core", max_age: float = 5.0) -> Tuple[int, int]:
         """
         Get current rate limit status
 
+        Results are cached per client for max_age seconds, so repeated checks
+        (e.g. before fanning out work) don't each cost a round-trip.
+
+        Args:
+            resource: Rate limit bucket (core, search, graphql)
+            max_age: Maximum age of cached status in seconds (0 forces a request)
+
         Returns:
             Tuple of (remaining requests, reset timestamp)
         """
+        cached = self._rl_cache.get(resource)
+        if cached and time.monotonic() - cached[0] < max_age:
+            return cached[1]
+
         response = self._make_request(f"{self.base_url}/rate_limit")
-        data = response.json()
-        core = data['resources']['core']
-        return core['remaining'], core['reset']
+        data = self._json(response)
+        now = time.monotonic()
+
+        # One request returns every bucket, so cache them all
+        for name, limits in data['resources'].items():
+            self._rl_cache[name] = (now, (limits['remaining'], limits['reset']))
+            if name in self.buckets:
+                self.buckets[name].update(limits.get('limit', 0), limits['remaining'], limits['reset'])
+
+        limits = data['resources'][resource]
+        return limits['remaining'], limits['reset']
 
     def get_pr_files(self, owner: str, repo: str, pr_number: int) -> List[Dict]:
         """
@@ -388,25 +905,97 @@ class GitHubClient:
             List of file dictionaries with filename, status, additions, deletions, etc.
         """
         files = []
-        page = 1
         per_page = 100  # Max per page for files endpoint
 
-        while True:
+        # GitHub API limits to 300 files per PR
+        for page_files in self._paginate(
+            f"{self.base_url}/repos/{owner}/{repo}/pulls/{pr_number}/files",
+            {"per_page": per_page},
+            max_pages=3
+        ):
+            files.extend(page_files)
+
+        return files
+
+    def get_pr_files_batch(
+        self,
+        owner: str,
+        repo: str,
+        pr_numbers: List[int],
+        batch_size: int = 25
+    ) -> Dict[int, List[Dict]]:
+        """
+        Get files changed in several pull requests with batched GraphQL queries
+
+        Each query asks for up to batch_size PRs (aliased pullRequest fields),
+        so N PRs cost about N / batch_size requests instead of N. GraphQL has
+        no patch field, so returned files have no 'patch'. PRs with more than
+        100 files fall back to get_pr_files.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            pr_numbers: Pull request numbers
+            batch_size: Number of PRs per GraphQL query
+
+        Returns:
+            Dictionary mapping PR number to list of file dictionaries
+            (filename, status, additions, deletions, changes like the REST API).
+            PRs that could not be fetched are missing from the result.
+        """
+        results = {}
+
+        for start in range(0, len(pr_numbers), batch_size):
+            chunk = pr_numbers[start:start + batch_size]
+
+            selections = "\n".join(
+                f"pr{i}: pullRequest(number: {number}) {{ ...prFiles }}"
+                for i, number in enumerate(chunk)
+            )
+            query = (
+                "query($owner: String!, $repo: String!) {\n"
+                "  repository(owner: $owner, name: $repo) {\n"
+                f"{selections}\n"
+                "  }\n"
+                "}\n"
+                "fragment prFiles on PullRequest {\n"
+                "  files(first: 100) {\n"
+                "    pageInfo { hasNextPage }\n"
+                "    nodes { path additions deletions changeType }\n"
+                "  }\n"
+                "}"
+            )
+
             response = self._make_request(
-                f"{self.base_url}/repos/{owner}/{repo}/pulls/{pr_number}/files",
-                params={"per_page": per_page, "page": page}
+                f"{self.base_url}/graphql",
+                json_body={"query": query, "variables": {"owner": owner, "repo": repo}}
             )
-            page_files = response.json()
+            data = self._json(response)
+            repository = (data.get('data') or {}).get('repository')
 
-            if not page_files:
-                break
+            if repository is None:
+                message = "; ".join(e.get('message', '') for e in data.get('errors', []))
+                raise GitHubAPIError(f"GraphQL query failed: {message or 'no data returned'}")
 
-            files.extend(page_files)
+            for i, number in enumerate(chunk):
+                pr = repository.get(f"pr{i}")
+                if not pr:
+                    continue
 
-            # GitHub API limits to 300 files per PR
-            if len(page_files) < per_page or len(files) >= 300:
-                break
+                if pr['files']['pageInfo']['hasNextPage']:
+                    results[number] = self.get_pr_files(owner, repo, number)
+                    continue
 
-            page += 1
+                results[number] = [
+                    {
+                        'filename': node['path'],
+                        'status': _GRAPHQL_CHANGE_TYPES.get(node['changeType'], node['changeType'].lower()),
+                        'additions': node['additions'],
+                        'deletions': node['deletions'],
+                        'changes': node['additions'] + node['deletions']
+                    }
+                    for node in pr['files']['nodes']
+                ]
+
+        return results
 
-        return files
\ No newline at end of file
@@ -3,14 +3,96 @@ Local PR data loader
 Loads pull request data from locally saved JSON files
 """
 
-import json
+import os
+import re
+import itertools
+import operator
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 from rich.console import Console
 
+from . import json_utils
+
 
 console = Console()
 
+# Sort key of PRs
+_created_at = operator.itemgetter('created_at')
+
+# Non-informative files (configs, locks, etc.) are matched anywhere in the path
+_EXCLUDE_PATTERNS = ('.lock', 'package-lock.json', 'yarn.lock', 'poetry.lock',
+                     '.idea/', '.vscode/', 'node_modules/', '__pycache__/')
+_EXCLUDE_RE = re.compile('|'.join(map(re.escape, _EXCLUDE_PATTERNS)))
+
+# Code files whose patches are shown (tuple for a single str.endswith call)
+_CODE_EXTENSIONS = ('.py', '.ts', '.tsx', '.js', '.jsx', '.java', '.go', '.rs',
+                    '.cpp', '.c', '.rb', '.php', '.vue', '.html', '.css', '.scss')
+
+# File extension -> technology
+_TECH_MAP = {
+    'py': 'Python',
+    'js': 'JavaScript',
+    'jsx': 'React',
+    'ts': 'TypeScript',
+    'tsx': 'React/TypeScript',
+    'java': 'Java',
+    'go': 'Go',
+    'rs': 'Rust',
+    'cpp': 'C++',
+    'c': 'C',
+    'rb': 'Ruby',
+    'php': 'PHP',
+    'vue': 'Vue',
+    'html': 'HTML',
+    'css': 'CSS',
+    'scss': 'SCSS',
+    'yaml': 'YAML',
+    'yml': 'YAML',
+    'json': 'JSON',
+    'md': 'Markdown',
+    'sql': 'SQL',
+    'sh': 'Shell',
+}
+
+# Added patch lines with imports, class/function definitions, decorators
+_KEY_LINE_RE = re.compile('|'.join(map(re.escape, (
+    'import ', 'from ', 'class ', 'def ', 'function ',
+    'const ', 'let ', 'var ', 'interface ', 'type ',
+    '@', 'async ', 'export '
+))))
+
+
+def _key_lines(patch: str) -> Iterator[str]:
+    """
+    Yield the added lines of a patch that contain a keyword
+
+    The keyword regex runs over the whole patch text, so only lines with a
+    keyword are looked at in Python (patches are mostly other lines).
+
+    Args:
+        patch: Unified diff of one file
+
+    Returns:
+        Iterator of patch lines, in order
+    """
+    pos = 0
+    size = len(patch)
+    while pos < size:
+        match = _KEY_LINE_RE.search(patch, pos)
+        if not match:
+            return
+        start = patch.rfind('\n', 0, match.start()) + 1
+        end = patch.find('\n', match.end())
+        if end == -1:
+            end = size
+        line = patch[start:end]
+        # Show added lines that are imports or definitions
+        if line.startswith('+') and not line.startswith('+++') and _KEY_LINE_RE.search(line[1:].strip()):
+            yield line
+        pos = end + 1
+
 
 class LocalPRLoader:
     """Load PR data from local JSON files"""
@@ -28,8 +110,6 @@ class LocalPRLoader:
         Returns:
             List of PR dictionaries
         """
-        prs = []
-
         if recursive:
             # Search all subdirectories
             pattern = "**/*.json"
@@ -44,19 +124,31 @@ class LocalPRLoader:
 
         console.print(f"[cyan]Found {len(pr_files)} PR files in {self.base_path}[/cyan]")
 
-        for pr_file in pr_files:
-            try:
-                with open(pr_file, 'r', encoding='utf-8') as f:
-                    pr_data = json.load(f)
-                    prs.append(pr_data)
-            except Exception as e:
-                console.print(f"[yellow]⚠️  Error loading {pr_file.name}: {e}[/yellow]")
+        # File reads overlap in a thread pool
+        if len(pr_files) > 1:
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 2, len(pr_files))) as executor:
+                loaded = list(executor.map(self._load_pr_file, pr_files))
+        else:
+            loaded = [self._load_pr_file(pr_file) for pr_file in pr_files]
+        prs = [pr_data for pr_data in loaded if pr_data is not None]
 
-        # Sort by created date (newest first)
-        prs.sort(key=lambda x: x.get('created_at', ''), reverse=True)
+        # Sort by created date (newest first); keys are computed before the
+        # list is reordered, so a PR without created_at leaves it untouched
+        try:
+            prs.sort(key=_created_at, reverse=True)
+        except KeyError:
+            prs.sort(key=lambda x: x.get('created_at', ''), reverse=True)
 
         return prs
 
+    def _load_pr_file(self, pr_file: Path) -> Optional[Dict]:
+        """Load single PR file, None (with a warning) if it can't be read"""
+        try:
+            return json_utils.loads(pr_file.read_bytes())
+        except Exception as e:
+            console.print(f"[yellow]⚠️  Error loading {pr_file.name}: {e}[/yellow]")
+            return None
+
     def load_prs_from_repos(self, org_name: str, repo_names: Optional[List[str]] = None) -> Dict[str, List[Dict]]:
         """
         Load PRs from multiple repositories
@@ -100,37 +192,38 @@ class LocalPRLoader:
         if not prs:
             return {}
 
-        stats = {
-            "total": len(prs),
-            "by_state": {},
-            "by_labels": {},
-            "date_range": {
-                "oldest": None,
-                "newest": None
-            }
-        }
+        state_counts = Counter()
+        label_counts = Counter()
+        oldest = newest = None
 
-        # Count by state
+        # Single pass over PRs
         for pr in prs:
-            state = pr.get('state', 'unknown')
-
             # Determine if merged
-            if pr.get('pull_request', {}).get('merged_at'):
-                state = 'merged'
-
-            stats["by_state"][state] = stats["by_state"].get(state, 0) + 1
+            if (pr.get('pull_request') or {}).get('merged_at'):
+                state_counts['merged'] += 1
+            else:
+                state_counts[pr.get('state', 'unknown')] += 1
 
             # Count labels
-            for label in pr.get('labels', []):
-                label_name = label.get('name', 'unknown')
-                stats["by_labels"][label_name] = stats["by_labels"].get(label_name, 0) + 1
+            label_counts.update(label.get('name', 'unknown') for label in pr.get('labels', ()))
+
+            # Date range
+            created_at = pr.get('created_at')
+            if created_at:
+                if oldest is None or created_at < oldest:
+                    oldest = created_at
+                if newest is None or created_at > newest:
+                    newest = created_at
 
-        # Date range
-        if prs:
-            dates = [pr.get('created_at') for pr in prs if pr.get('created_at')]
-            if dates:
-                stats["date_range"]["oldest"] = min(dates)
-                stats["date_range"]["newest"] = max(dates)
+        stats = {
+            "total": len(prs),
+            "by_state": dict(state_counts),
+            "by_labels": dict(label_counts),
+            "date_range": {
+                "oldest": oldest,
+                "newest": newest
+            }
+        }
 
         return stats
 
@@ -158,121 +251,86 @@ class LocalPRLoader:
         created_at = pr.get('created_at', 'N/A')
         comments = pr.get('comments', 0)
 
-        # Build base compressed info
-        compressed = f"""
+        # Build base compressed info; output lines are collected and joined once
+        parts = [f"""
 PR #{number}: {title}
 State: {state}
 Created: {created_at}
 Labels: {', '.join(labels) if labels else 'None'}
 Comments: {comments}
 Description: {body}...
-""".strip()
+""".strip()]
 
         # Add file information if available
         files = pr.get('files', [])
         if files:
             file_count = len(files)
-            total_additions = sum(f.get('additions', 0) for f in files)
-            total_deletions = sum(f.get('deletions', 0) for f in files)
+            total_additions = 0
+            total_deletions = 0
 
             # Detect technologies from file extensions
             technologies = set()
             file_details = []
+            files_with_patch = []
+            more_count = 0
 
-            # Filter out non-informative files (configs, locks, etc.)
-            exclude_patterns = ['.lock', 'package-lock.json', 'yarn.lock', 'poetry.lock',
-                              '.idea/', '.vscode/', 'node_modules/', '__pycache__/']
+            # Single pass: totals over all files, details of the first 10
+            # informative files and up to 5 code files with patches
+            for file_data in files:
+                additions = file_data.get('additions', 0)
+                deletions = file_data.get('deletions', 0)
+                total_additions += additions
+                total_deletions += deletions
 
-            informative_files = [
-                f for f in files
-                if not any(pattern in f.get('filename', '') for pattern in exclude_patterns)
-            ]
+                # Filter out non-informative files (configs, locks, etc.)
+                filename = file_data.get('filename', '')
+                if _EXCLUDE_RE.search(filename):
+                    continue
 
-            # Prioritize code files for patch display
-            code_extensions = ['.py', '.ts', '.tsx', '.js', '.jsx', '.java', '.go', '.rs',
-                             '.cpp', '.c', '.rb', '.php', '.vue', '.html', '.css', '.scss']
-            files_with_patch = [
-                f for f in informative_files
-                if f.get('patch') and any(f.get('filename', '').endswith(ext) for ext in code_extensions)
-            ]
+                # Prioritize code files for patch display
+                if len(files_with_patch) < 5 and file_data.get('patch') and filename.endswith(_CODE_EXTENSIONS):
+                    files_with_patch.append(file_data)
 
-            for file_data in informative_files[:10]:  # Limit to first 10 files to save tokens
-                filename = file_data.get('filename', '')
-                status = file_data.get('status', '')
-                additions = file_data.get('additions', 0)
-                deletions = file_data.get('deletions', 0)
+                if len(file_details) >= 10:  # Limit to first 10 files to save tokens
+                    more_count += 1
+                    continue
 
                 # Extract technology from extension
                 if '.' in filename:
                     ext = filename.split('.')[-1].lower()
-                    tech_map = {
-                        'py': 'Python',
-                        'js': 'JavaScript',
-                        'jsx': 'React',
-                        'ts': 'TypeScript',
-                        'tsx': 'React/TypeScript',
-                        'java': 'Java',
-                        'go': 'Go',
-                        'rs': 'Rust',
-                        'cpp': 'C++',
-                        'c': 'C',
-                        'rb': 'Ruby',
-                        'php': 'PHP',
-                        'vue': 'Vue',
-                        'html': 'HTML',
-                        'css': 'CSS',
-                        'scss': 'SCSS',
-                        'yaml': 'YAML',
-                        'yml': 'YAML',
-                        'json': 'JSON',
-                        'md': 'Markdown',
-                        'sql': 'SQL',
-                        'sh': 'Shell',
-                    }
-                    if ext in tech_map:
-                        technologies.add(tech_map[ext])
-
-                file_details.append(f"  - {filename}: +{additions} -{deletions} ({status})")
+                    if ext in _TECH_MAP:
+                        technologies.add(_TECH_MAP[ext])
+
+                file_details.append(f"  - {filename}: +{additions} -{deletions} ({file_data.get('status', '')})")
 
             # Add files section to compressed output
-            compressed += f"\n\nFiles changed ({file_count}): +{total_additions} -{total_deletions}"
+            parts.append("")
+            parts.append(f"Files changed ({file_count}): +{total_additions} -{total_deletions}")
             if technologies:
-                compressed += f"\nTechnologies: {', '.join(sorted(technologies))}"
-            compressed += "\n" + "\n".join(file_details)
+                parts.append(f"Technologies: {', '.join(sorted(technologies))}")
+            parts.extend(file_details or [""])
 
-            if len(informative_files) > 10:
-                compressed += f"\n  ... and {len(informative_files) - 10} more files"
+            if more_count:
+                parts.append(f"  ... and {more_count} more files")
 
             # Add key code changes section with patches (up to 5 files)
             if files_with_patch:
-                compressed += "\n\nKey code changes:"
-                for file_data in files_with_patch[:5]:  # Show up to 5 files with patches
+                parts.append("")
+                parts.append("Key code changes:")
+                for file_data in files_with_patch:
                     filename = file_data.get('filename', '')
                     additions = file_data.get('additions', 0)
                     deletions = file_data.get('deletions', 0)
                     status = file_data.get('status', '')
                     patch = file_data.get('patch', '')
 
-                    compressed += f"\n  - {filename}: +{additions} -{deletions} ({status})"
+                    parts.append(f"  - {filename}: +{additions} -{deletions} ({status})")
 
                     # Extract key lines from patch (imports, class/function definitions)
                     if patch:
-                        key_lines = []
-                        for line in patch.split('\n'):
-                            # Show added lines that are imports or definitions
-                            if line.startswith('+') and not line.startswith('+++'):
-                                stripped = line[1:].strip()
-                                # Include imports, class/function defs, decorators
-                                if any(keyword in stripped for keyword in [
-                                    'import ', 'from ', 'class ', 'def ', 'function ',
-                                    'const ', 'let ', 'var ', 'interface ', 'type ',
-                                    '@', 'async ', 'export '
-                                ]):
-                                    key_lines.append(f"    {line}")
-                                    if len(key_lines) >= 3:  # Max 3 lines per file
-                                        break
-
-                        if key_lines:
-                            compressed += "\n" + "\n".join(key_lines)
-
-        return compressed
\ No newline at end of file
+                        parts.extend(
+                            f"    {line}"
+                            for line in itertools.islice(_key_lines(patch), 3)  # Max 3 lines per file
+                        )
+
+        return "\n".join(parts)
\ No newline at end of file